@@ -2,15 +2,207 @@
 # Path: OllamaModelEditor/Core/ConfigManager.py
 # Standard: AIDEV-PascalCase-1.2
 # Created: 2025-03-11
-# Last Modified: 2025-03-13
+# Last Modified: 2026-10-15
 # Description: Configuration management for the OllamaModelEditor application
 
 import os
 import json
+import functools
+import mmap
 import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional, Union, List
 import logging
+from collections import deque, defaultdict
+from contextlib import contextmanager, nullcontext
+from itertools import groupby
+from operator import itemgetter
+
+# Prefer the libyaml-backed loader/dumper, falling back to pure Python
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# Prefer orjson for JSON I/O, falling back to the standard library
+try:
+    import orjson
+    
+    _JsonLoads = orjson.loads
+    _JsonDumps = functools.partial(orjson.dumps, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    orjson = None
+    
+    _JsonLoads = json.loads
+    
+    def _JsonDumps(Data: Any) -> bytes:
+        return json.dumps(Data, indent=2).encode('utf-8')
+
+# Optional zstd support for compressed configuration files (Config.json.zst)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+def _ReadJsonFile(FilePath: Union[str, Path]) -> Any:
+    """
+    Parse a JSON file.
+    
+    With orjson the file is parsed straight from a read-only memory map, so its
+    contents are never copied into an intermediate bytes object.
+    
+    Args:
+        FilePath: Path to the JSON file
+        
+    Returns:
+        Parsed JSON data
+    """
+    with open(FilePath, 'rb') as JsonFile:
+        # Empty files can't be mapped; let the parser report them as invalid
+        if orjson is None or os.fstat(JsonFile.fileno()).st_size == 0:
+            return _JsonLoads(JsonFile.read())
+        
+        with mmap.mmap(JsonFile.fileno(), 0, access=mmap.ACCESS_READ) as Mapped:
+            with memoryview(Mapped) as View:
+                return orjson.loads(View)
+
+def _WriteFileAtomic(FilePath: Union[str, Path], Data: bytes) -> None:
+    """
+    Write a file through a temporary sibling and an atomic rename.
+    
+    A crash mid-write leaves the previous file intact, and concurrent readers
+    see either the old or the new contents, never a partial file.
+    
+    Args:
+        FilePath: Destination path
+        Data: File contents
+    """
+    FilePath = Path(FilePath)
+    TempPath = FilePath.with_name(FilePath.name + '.tmp')
+    
+    try:
+        with open(TempPath, 'wb') as TempFile:
+            TempFile.write(Data)
+            TempFile.flush()
+            os.fsync(TempFile.fileno())
+        
+        os.replace(TempPath, FilePath)
+    except BaseException:
+        TempPath.unlink(missing_ok=True)
+        raise
+
+# Qt value types that can be round-tripped through configuration files
+try:
+    from PySide6.QtCore import QByteArray, QSize, QRect, QPoint
+except ImportError:
+    QByteArray = QSize = QRect = QPoint = None
+
+if QByteArray is not None:
+    _QtSerializers = {
+        QByteArray: lambda Value: {'__qt_type__': 'QByteArray', 'data': bytes(Value).hex()},
+        QSize: lambda Value: {'__qt_type__': 'QSize', 'width': Value.width(), 'height': Value.height()},
+        QRect: lambda Value: {
+            '__qt_type__': 'QRect',
+            'x': Value.x(),
+            'y': Value.y(),
+            'width': Value.width(),
+            'height': Value.height()
+        },
+        QPoint: lambda Value: {'__qt_type__': 'QPoint', 'x': Value.x(), 'y': Value.y()}
+    }
+    
+    _QtDeserializers = {
+        'QByteArray': lambda Value: QByteArray.fromHex(bytes.fromhex(Value['data'])),
+        'QSize': lambda Value: QSize(Value['width'], Value['height']),
+        'QRect': lambda Value: QRect(Value['x'], Value['y'], Value['width'], Value['height']),
+        'QPoint': lambda Value: QPoint(Value['x'], Value['y'])
+    }
+else:
+    _QtSerializers = {}
+    _QtDeserializers = {}
+
+def _SerializeQtTree(Config: dict) -> dict:
+    """
+    Walk a nested configuration dictionary, converting Qt objects to plain data.
+    
+    Kept at module level with the hot lookups bound to locals so the loop does no
+    attribute or global lookups per node.
+    
+    Args:
+        Config: Configuration dictionary
+        
+    Returns:
+        Dictionary with serialized Qt objects
+    """
+    SerializedConfig: dict = {}
+    GetSerializer = _QtSerializers.get
+    HasQt = bool(_QtSerializers)
+    
+    # Walk nested dictionaries with an explicit work list instead of recursion
+    Pending = deque([(SerializedConfig, Config)])
+    Push = Pending.append
+    Pop = Pending.pop
+    
+    while Pending:
+        Target, Source = Pop()
+        
+        for Key, Value in Source.items():
+            ValueType = type(Value)
+            Handler = GetSerializer(ValueType)
+            
+            if Handler:
+                Target[Key] = Handler(Value)
+            elif ValueType is dict or isinstance(Value, dict):
+                Target[Key] = Child = {}
+                Push((Child, Value))
+            elif HasQt and ValueType.__module__.startswith('PySide6'):
+                # Other Qt objects - store class name and basic representation
+                Target[Key] = {
+                    '__qt_type__': ValueType.__name__,
+                    'repr': repr(Value)
+                }
+            else:
+                Target[Key] = Value
+    
+    return SerializedConfig
+
+def _DeserializeQtTree(Config: dict) -> dict:
+    """
+    Walk a nested configuration dictionary, rebuilding serialized Qt objects.
+    
+    Args:
+        Config: Configuration dictionary with serialized Qt objects
+        
+    Returns:
+        Dictionary with deserialized Qt objects
+    """
+    DeserializedConfig: dict = {}
+    GetDeserializer = _QtDeserializers.get
+    
+    # Walk nested dictionaries with an explicit work list instead of recursion
+    Pending = deque([(DeserializedConfig, Config)])
+    Push = Pending.append
+    Pop = Pending.pop
+    
+    while Pending:
+        Target, Source = Pop()
+        
+        for Key, Value in Source.items():
+            if not isinstance(Value, dict):
+                Target[Key] = Value
+                continue
+            
+            QtType = Value.get('__qt_type__')
+            
+            if QtType is None:
+                Target[Key] = Child = {}
+                Push((Child, Value))
+            else:
+                # Qt objects we can't reconstruct keep their type information
+                Handler = GetDeserializer(QtType)
+                Target[Key] = Handler(Value) if Handler else Value
+    
+    return DeserializedConfig
 
 # Import DBManager if available
 try:
@@ -18,9 +210,52 @@ try:
 except ImportError:
     DBManager = None
 
+# Configuration sections persisted by SaveConfig
+_ConfigSections = ('AppConfig', 'ModelConfigs', 'UserPreferences')
+
+def _IsQtObject(Value: Any) -> bool:
+    """Check whether a value is, or contains, a PySide6 object that needs serializing."""
+    # Walk nested containers with an explicit work list instead of recursion
+    Pending = deque([Value])
+    Push = Pending.extend
+    Pop = Pending.pop
+    
+    while Pending:
+        Item = Pop()
+        
+        if type(Item).__module__.startswith('PySide6'):
+            return True
+        
+        if isinstance(Item, dict):
+            Push(Item.values())
+        elif isinstance(Item, (list, tuple)):
+            Push(Item)
+    
+    return False
+
+# Sentinel for missing keys, distinct from a stored None
+_Missing = object()
+
+# Converters for typed values stored in the database, keyed by ValueType
+# (numbers are stored natively; bools are stored as 0/1)
+_ValueConverters = {
+    'bool': bool,
+    'json': _JsonLoads
+}
+
+# Required model parameters: (name, accepted types, minimum, maximum, error message)
+_ModelConfigRules = (
+    ('Temperature', (int, float), 0, 2, "Temperature must be a number between 0 and 2"),
+    ('TopP', (int, float), 0, 1, "TopP must be a number between 0 and 1"),
+    ('MaxTokens', int, 1, None, "MaxTokens must be a positive integer")
+)
+
 class ConfigManager:
     """Manages application configuration settings and model parameters."""
     
+    # Resolved default configuration path, shared by all instances
+    _DefaultConfigPath: Optional[str] = None
+    
     def __init__(self, ConfigPath: Optional[str] = None, DB: Optional['DBManager'] = None):
         """
         Initialize the configuration manager.
@@ -36,6 +271,14 @@ class ConfigManager:
         self.ModelConfigs = {}
         self.UserPreferences = {}
         
+        # Serialized sections from the last file save and keys changed since then
+        # (None when any part of the section may have changed)
+        self._SerializedCache = {}
+        self._DirtyKeys = {Section: set() for Section in _ConfigSections}
+        
+        # Sections that may hold Qt objects; model configs only hold numeric parameters
+        self._HasQtObjects = {Section: False for Section in _ConfigSections}
+        
         # Set default configuration path if not provided
         if not self.ConfigPath:
             self.ConfigPath = self._GetDefaultConfigPath()
@@ -47,6 +290,10 @@ class ConfigManager:
         Returns:
             str: Path to the default configuration directory
         """
+        # Resolve (and create) the directory only once per process
+        if ConfigManager._DefaultConfigPath:
+            return ConfigManager._DefaultConfigPath
+        
         # Get user's home directory
         HomeDir = Path.home()
         
@@ -59,7 +306,28 @@ class ConfigManager:
         # Create directory if it doesn't exist
         ConfigDir.mkdir(parents=True, exist_ok=True)
         
-        return str(ConfigDir / 'Config.yaml')
+        ConfigManager._DefaultConfigPath = str(ConfigDir / 'Config.json')
+        return ConfigManager._DefaultConfigPath
+    
+    def _GetLegacyConfigPath(self, ConfigPath: Path) -> Optional[Path]:
+        """
+        Locate a legacy YAML configuration stored next to a JSON configuration path.
+        
+        Args:
+            ConfigPath: Path to the JSON configuration file
+            
+        Returns:
+            Path to the legacy YAML file, or None if there is none
+        """
+        if ConfigPath.suffix.lower() != '.json':
+            return None
+        
+        for Suffix in ('.yaml', '.yml'):
+            LegacyPath = ConfigPath.with_suffix(Suffix)
+            if LegacyPath.exists():
+                return LegacyPath
+        
+        return None
     
     def _SerializeQtObjects(self, Config: Dict) -> Dict:
         """
@@ -71,40 +339,7 @@ class ConfigManager:
         Returns:
             Dictionary with serialized Qt objects
         """
-        SerializedConfig = {}
-        
-        for Key, Value in Config.items():
-            if hasattr(Value, '__class__') and Value.__class__.__module__.startswith('PySide6'):
-                # Handle QByteArray
-                if Value.__class__.__name__ == 'QByteArray':
-                    SerializedConfig[Key] = {'__qt_type__': 'QByteArray', 'data': bytes(Value).hex()}
-                # Handle QSize
-                elif Value.__class__.__name__ == 'QSize':
-                    SerializedConfig[Key] = {'__qt_type__': 'QSize', 'width': Value.width(), 'height': Value.height()}
-                # Handle QRect
-                elif Value.__class__.__name__ == 'QRect':
-                    SerializedConfig[Key] = {
-                        '__qt_type__': 'QRect', 
-                        'x': Value.x(), 
-                        'y': Value.y(),
-                        'width': Value.width(), 
-                        'height': Value.height()
-                    }
-                # Handle QPoint
-                elif Value.__class__.__name__ == 'QPoint':
-                    SerializedConfig[Key] = {'__qt_type__': 'QPoint', 'x': Value.x(), 'y': Value.y()}
-                # Other Qt objects - store class name and basic representation
-                else:
-                    SerializedConfig[Key] = {
-                        '__qt_type__': Value.__class__.__name__,
-                        'repr': repr(Value)
-                    }
-            elif isinstance(Value, dict):
-                SerializedConfig[Key] = self._SerializeQtObjects(Value)
-            else:
-                SerializedConfig[Key] = Value
-                
-        return SerializedConfig
+        return _SerializeQtTree(Config)
     
     def _DeserializeQtObjects(self, Config: Dict) -> Dict:
         """
@@ -116,33 +351,61 @@ class ConfigManager:
         Returns:
             Dictionary with deserialized Qt objects
         """
-        from PySide6.QtCore import QByteArray, QSize, QRect, QPoint
+        return _DeserializeQtTree(Config)
+    
+    def _GetSerializedSection(self, Section: str) -> Dict:
+        """
+        Serialize a configuration section, reusing the previous save where possible.
         
-        DeserializedConfig = {}
+        Args:
+            Section: Name of the configuration section attribute
+            
+        Returns:
+            Dictionary with serialized Qt objects
+        """
+        Source = getattr(self, Section)
+        Cached = self._SerializedCache.get(Section)
         
-        for Key, Value in Config.items():
-            if isinstance(Value, dict) and '__qt_type__' in Value:
-                # Reconstruct Qt objects based on type
-                QtType = Value['__qt_type__']
-                
-                if QtType == 'QByteArray':
-                    DeserializedConfig[Key] = QByteArray.fromHex(bytes.fromhex(Value['data']))
-                elif QtType == 'QSize':
-                    DeserializedConfig[Key] = QSize(Value['width'], Value['height'])
-                elif QtType == 'QRect':
-                    DeserializedConfig[Key] = QRect(Value['x'], Value['y'], Value['width'], Value['height'])
-                elif QtType == 'QPoint':
-                    DeserializedConfig[Key] = QPoint(Value['x'], Value['y'])
-                else:
-                    # For other Qt objects, we can't fully reconstruct them
-                    # So we'll keep them as dictionaries with their type information
-                    DeserializedConfig[Key] = Value
-            elif isinstance(Value, dict):
-                DeserializedConfig[Key] = self._DeserializeQtObjects(Value)
+        # Sections without Qt objects are passed through with a shallow copy
+        Serialize = self._SerializeQtObjects if self._HasQtObjects[Section] else dict
+        
+        DirtyKeys = self._DirtyKeys[Section]
+        
+        # Sections replaced wholesale (LoadConfig, defaults) or handed out for
+        # modification are serialized from scratch
+        if Cached is None or Cached[0] is not Source or DirtyKeys is None:
+            return Serialize(Source)
+        
+        if not DirtyKeys:
+            return Cached[1]
+        
+        # Re-serialize changed keys and leave out removed ones
+        Serialized = dict(Cached[1])
+        Changed = {}
+        
+        for Key in DirtyKeys:
+            if Key in Source:
+                Changed[Key] = Source[Key]
             else:
-                DeserializedConfig[Key] = Value
-                
-        return DeserializedConfig
+                Serialized.pop(Key, None)
+        
+        Serialized.update(Serialize(Changed))
+        return Serialized
+    
+    def _MarkDirty(self, Section: str, Key: Optional[str] = None) -> None:
+        """
+        Record a change to a configuration section for the next file save.
+        
+        Args:
+            Section: Name of the configuration section attribute
+            Key: Changed key, or None if any part of the section may have changed
+        """
+        DirtyKeys = self._DirtyKeys[Section]
+        
+        if Key is None:
+            self._DirtyKeys[Section] = None
+        elif DirtyKeys is not None:
+            DirtyKeys.add(Key)
     
     def LoadConfig(self) -> bool:
         """
@@ -174,18 +437,30 @@ class ConfigManager:
         try:
             ConfigPath = Path(self.ConfigPath)
             
+            # Fall back to a legacy YAML configuration; the next save rewrites it as JSON
+            if not ConfigPath.exists():
+                LegacyPath = self._GetLegacyConfigPath(ConfigPath)
+                if LegacyPath:
+                    self.Logger.info(f"Migrating legacy configuration file: {LegacyPath}")
+                    ConfigPath = LegacyPath
+            
             # Create default configuration if file doesn't exist
             if not ConfigPath.exists():
                 self._CreateDefaultConfig()
                 return True
             
             # Load configuration based on file extension
-            if ConfigPath.suffix.lower() == '.json':
-                with open(ConfigPath, 'r') as ConfigFile:
-                    ConfigData = json.load(ConfigFile)
+            if ConfigPath.suffix.lower() == '.zst':
+                if zstandard is None:
+                    self.Logger.error("Compressed configuration requires the zstandard package")
+                    return False
+                
+                ConfigData = _JsonLoads(zstandard.ZstdDecompressor().decompress(ConfigPath.read_bytes()))
+            elif ConfigPath.suffix.lower() == '.json':
+                ConfigData = _ReadJsonFile(ConfigPath)
             elif ConfigPath.suffix.lower() in ['.yaml', '.yml']:
                 with open(ConfigPath, 'r') as ConfigFile:
-                    ConfigData = yaml.safe_load(ConfigFile)
+                    ConfigData = yaml.load(ConfigFile, Loader=_YamlLoader)
             else:
                 self.Logger.error(f"Unsupported configuration file format: {ConfigPath.suffix}")
                 return False
@@ -200,6 +475,10 @@ class ConfigManager:
             if 'UserPreferences' in ConfigData:
                 self.UserPreferences = self._DeserializeQtObjects(ConfigData.get('UserPreferences', {}))
             
+            # Window state and similar Qt values may have been restored from the file
+            for Section in _ConfigSections:
+                self._HasQtObjects[Section] = _IsQtObject(getattr(self, Section))
+            
             self.Logger.info(f"Configuration loaded from file: {ConfigPath}")
             return True
             
@@ -209,51 +488,42 @@ class ConfigManager:
             self._CreateDefaultConfig()
             return False
     
-    def _LoadAppConfigFromDB(self) -> None:
-        """Load application configuration from database."""
-        # Get all app settings
-        Settings = self.DB.ExecuteQuery(
-            "SELECT Key, Value, ValueType FROM AppSettings"
+    def _LoadTypedValuesFromDB(self, Table: str) -> Dict[str, Any]:
+        """
+        Load a typed key/value table from the database.
+        
+        Rows are fetched grouped by value type so each group is converted by a
+        single converter instead of a per-row type check.
+        
+        Args:
+            Table: Name of the key/value table
+            
+        Returns:
+            Dictionary of converted values
+        """
+        Rows = self.DB.ExecuteQuery(
+            f"SELECT ValueType, Key, Value FROM {Table} ORDER BY ValueType"
         )
         
-        # Clear existing app config
-        self.AppConfig = {}
+        Values = {}
         
-        # Convert settings to appropriate types and add to AppConfig
-        for Key, Value, ValueType in Settings:
-            if ValueType == "int":
-                self.AppConfig[Key] = int(Value)
-            elif ValueType == "float":
-                self.AppConfig[Key] = float(Value)
-            elif ValueType == "bool":
-                self.AppConfig[Key] = Value.lower() in ("true", "1", "yes")
-            elif ValueType == "json":
-                self.AppConfig[Key] = json.loads(Value)
+        for ValueType, Group in groupby(Rows, key=itemgetter(0)):
+            Converter = _ValueConverters.get(ValueType)
+            
+            if Converter is None:
+                Values.update((Key, Value) for _, Key, Value in Group)
             else:
-                self.AppConfig[Key] = Value
+                Values.update((Key, Converter(Value)) for _, Key, Value in Group)
+        
+        return Values
+    
+    def _LoadAppConfigFromDB(self) -> None:
+        """Load application configuration from database."""
+        self.AppConfig = self._LoadTypedValuesFromDB('AppSettings')
     
     def _LoadUserPreferencesFromDB(self) -> None:
         """Load user preferences from database."""
-        # Get all user preferences
-        Preferences = self.DB.ExecuteQuery(
-            "SELECT Key, Value, ValueType FROM UserPreferences"
-        )
-        
-        # Clear existing preferences
-        self.UserPreferences = {}
-        
-        # Convert preferences to appropriate types and add to UserPreferences
-        for Key, Value, ValueType in Preferences:
-            if ValueType == "int":
-                self.UserPreferences[Key] = int(Value)
-            elif ValueType == "float":
-                self.UserPreferences[Key] = float(Value)
-            elif ValueType == "bool":
-                self.UserPreferences[Key] = Value.lower() in ("true", "1", "yes")
-            elif ValueType == "json":
-                self.UserPreferences[Key] = json.loads(Value)
-            else:
-                self.UserPreferences[Key] = Value
+        self.UserPreferences = self._LoadTypedValuesFromDB('UserPreferences')
     
     def _LoadModelConfigsFromDB(self) -> None:
         """Load model configurations from database."""
@@ -266,23 +536,19 @@ class ConfigManager:
             """
         )
         
-        # Clear existing model configs
-        self.ModelConfigs = {}
-        
-        # Group configurations by model
+        # Group configurations by model in a single pass
+        Grouped = defaultdict(dict)
         for ModelName, ConfigName, Temperature, TopP, MaxTokens, FrequencyPenalty, PresencePenalty in ModelConfigs:
-            # Create model entry if it doesn't exist
-            if ModelName not in self.ModelConfigs:
-                self.ModelConfigs[ModelName] = {}
-            
-            # Add configuration
-            self.ModelConfigs[ModelName][ConfigName] = {
+            Grouped[ModelName][ConfigName] = {
                 'Temperature': Temperature,
                 'TopP': TopP,
                 'MaxTokens': MaxTokens,
                 'FrequencyPenalty': FrequencyPenalty,
                 'PresencePenalty': PresencePenalty
             }
+        
+        # Replace existing model configs with a plain dict
+        self.ModelConfigs = dict(Grouped)
     
     def SaveConfig(self) -> bool:
         """
@@ -294,13 +560,12 @@ class ConfigManager:
         # If using database, save there
         if self.DB:
             try:
-                # Save app config to database
-                for Key, Value in self.AppConfig.items():
-                    self.DB.SetAppSetting(Key, Value)
-                
-                # Save user preferences to database
-                for Key, Value in self.UserPreferences.items():
-                    self.DB.SetUserPreference(Key, Value)
+                with self.DB.Transaction():
+                    # Save app config to database
+                    self.DB.SetAppSettingsBulk(self.AppConfig.items())
+                    
+                    # Save user preferences to database
+                    self.DB.SetUserPreferencesBulk(self.UserPreferences.items())
                 
                 # Save model configs to database (handled by ModelManager)
                 # We don't save model configs here to avoid overwriting changes
@@ -317,26 +582,34 @@ class ConfigManager:
             ConfigPath = Path(self.ConfigPath)
             
             # Prepare configuration data
-            ConfigData = {
-                'AppConfig': self._SerializeQtObjects(self.AppConfig),
-                'ModelConfigs': self._SerializeQtObjects(self.ModelConfigs),
-                'UserPreferences': self._SerializeQtObjects(self.UserPreferences)
-            }
+            ConfigData = {Section: self._GetSerializedSection(Section) for Section in _ConfigSections}
             
-            # Create directory if it doesn't exist
-            ConfigPath.parent.mkdir(parents=True, exist_ok=True)
+            # Create directory if it doesn't exist (a stat is cheaper than mkdir on every save)
+            if not ConfigPath.parent.exists():
+                ConfigPath.parent.mkdir(parents=True, exist_ok=True)
             
             # Save configuration based on file extension
-            if ConfigPath.suffix.lower() == '.json':
-                with open(ConfigPath, 'w') as ConfigFile:
-                    json.dump(ConfigData, ConfigFile, indent=2)
+            if ConfigPath.suffix.lower() == '.zst':
+                if zstandard is None:
+                    self.Logger.error("Compressed configuration requires the zstandard package")
+                    return False
+                
+                FileData = zstandard.ZstdCompressor(level=3).compress(_JsonDumps(ConfigData))
+            elif ConfigPath.suffix.lower() == '.json':
+                FileData = _JsonDumps(ConfigData)
             elif ConfigPath.suffix.lower() in ['.yaml', '.yml']:
-                with open(ConfigPath, 'w') as ConfigFile:
-                    yaml.dump(ConfigData, ConfigFile, default_flow_style=False)
+                FileData = yaml.dump(ConfigData, Dumper=_YamlDumper, default_flow_style=False).encode('utf-8')
             else:
                 self.Logger.error(f"Unsupported configuration file format: {ConfigPath.suffix}")
                 return False
             
+            _WriteFileAtomic(ConfigPath, FileData)
+            
+            # Remember what was written so unchanged sections are not re-serialized
+            for Section in _ConfigSections:
+                self._SerializedCache[Section] = (getattr(self, Section), ConfigData[Section])
+                self._DirtyKeys[Section] = set()
+            
             self.Logger.info(f"Configuration saved to file: {ConfigPath}")
             return True
             
@@ -377,16 +650,14 @@ class ConfigManager:
         
         # Save default configuration
         if self.DB:
-            # Save to database
-            for Key, Value in self.AppConfig.items():
-                self.DB.SetAppSetting(Key, Value)
-            
-            for Key, Value in self.UserPreferences.items():
-                self.DB.SetUserPreference(Key, Value)
-            
-            # Save default parameters
-            DefaultParams = self.ModelConfigs['DefaultParameters']
-            self.DB.SaveModelConfig('DefaultParameters', 'Default', DefaultParams)
+            # Save to database in a single transaction
+            with self.DB.Transaction():
+                self.DB.SetAppSettingsBulk(self.AppConfig.items())
+                self.DB.SetUserPreferencesBulk(self.UserPreferences.items())
+                
+                # Save default parameters
+                DefaultParams = self.ModelConfigs['DefaultParameters']
+                self.DB.SaveModelConfig('DefaultParameters', 'Default', DefaultParams)
             
             self.Logger.info("Default configuration created and saved to database")
         else:
@@ -407,13 +678,18 @@ class ConfigManager:
         """
         if self.DB and Key:
             # Try to get from database first
-            Value = self.DB.GetAppSetting(Key, None)
+            Value = self.DB.GetAppSetting(Key)
             if Value is not None:
                 return Value
         
-        # Fall back to memory cache
+        # Fall back to memory cache; containers handed out may be changed in place
         if Key:
-            return self.AppConfig.get(Key, Default)
+            Value = self.AppConfig.get(Key, Default)
+            if isinstance(Value, (dict, list)) and Key in self.AppConfig:
+                self._MarkDirty('AppConfig', Key)
+            return Value
+        
+        self._MarkDirty('AppConfig')
         return self.AppConfig
     
     def SetAppConfig(self, Key: str, Value: Any) -> None:
@@ -425,6 +701,9 @@ class ConfigManager:
             Value: Configuration value
         """
         self.AppConfig[Key] = Value
+        self._MarkDirty('AppConfig', Key)
+        if _IsQtObject(Value):
+            self._HasQtObjects['AppConfig'] = True
         
         # Save to database if available
         if self.DB:
@@ -452,8 +731,13 @@ class ConfigManager:
                     'PresencePenalty': Config['PresencePenalty']
                 }
         
-        # Fall back to memory cache
-        return self.ModelConfigs.get(ModelName, self.ModelConfigs.get('DefaultParameters', {}))
+        # Fall back to memory cache; callers may change the returned config in place
+        if ModelName in self.ModelConfigs:
+            self._MarkDirty('ModelConfigs', ModelName)
+            return self.ModelConfigs[ModelName]
+        
+        # Hand out a copy of the defaults so callers can't modify them in place
+        return dict(self.ModelConfigs.get('DefaultParameters', {}))
     
     def SetModelConfig(self, ModelName: str, Config: Dict[str, Any]) -> None:
         """
@@ -464,6 +748,9 @@ class ConfigManager:
             Config: Model configuration
         """
         self.ModelConfigs[ModelName] = Config
+        self._MarkDirty('ModelConfigs', ModelName)
+        if _IsQtObject(Config):
+            self._HasQtObjects['ModelConfigs'] = True
         
         # Save to database if available
         if self.DB:
@@ -482,12 +769,15 @@ class ConfigManager:
         """
         if self.DB:
             # Try to get from database first
-            Value = self.DB.GetUserPreference(Key, None)
+            Value = self.DB.GetUserPreference(Key)
             if Value is not None:
                 return Value
         
-        # Fall back to memory cache
-        return self.UserPreferences.get(Key, Default)
+        # Fall back to memory cache; containers handed out may be changed in place
+        Value = self.UserPreferences.get(Key, Default)
+        if isinstance(Value, (dict, list)) and Key in self.UserPreferences:
+            self._MarkDirty('UserPreferences', Key)
+        return Value
     
     def SetUserPreference(self, Key: str, Value: Any) -> None:
         """
@@ -498,11 +788,24 @@ class ConfigManager:
             Value: Preference value
         """
         self.UserPreferences[Key] = Value
+        self._MarkDirty('UserPreferences', Key)
+        if _IsQtObject(Value):
+            self._HasQtObjects['UserPreferences'] = True
         
         # Save to database if available
         if self.DB:
             self.DB.SetUserPreference(Key, Value)
     
+    @contextmanager
+    def BatchUpdates(self):
+        """
+        Commit the database writes of several setters together.
+        
+        Without a database the setters only touch memory, so the block runs as is.
+        """
+        with self.DB.Transaction() if self.DB else nullcontext():
+            yield
+    
     def AddRecentModel(self, ModelName: str) -> None:
         """
         Add model to recent models list.
@@ -510,8 +813,10 @@ class ConfigManager:
         Args:
             ModelName: Name of the model
         """
-        # Get current recent models list
-        RecentModels = self.GetUserPreference('RecentModels', [])
+        # The in-memory copy is authoritative, so skip the database lookup
+        RecentModels = self.UserPreferences.get('RecentModels')
+        if RecentModels is None:
+            RecentModels = []
         
         # Remove model if it already exists in the list
         if ModelName in RecentModels:
@@ -521,7 +826,7 @@ class ConfigManager:
         RecentModels.insert(0, ModelName)
         
         # Keep only the 10 most recent models
-        RecentModels = RecentModels[:10]
+        del RecentModels[10:]
         
         # Update preference
         self.SetUserPreference('RecentModels', RecentModels)
@@ -552,15 +857,15 @@ class ConfigManager:
             FileExt = Path(FilePath).suffix.lower()
             
             if FileExt == '.json':
-                with open(FilePath, 'w') as ExportFile:
-                    json.dump(ModelConfig, ExportFile, indent=2)
+                FileData = _JsonDumps(ModelConfig)
             elif FileExt in ['.yaml', '.yml']:
-                with open(FilePath, 'w') as ExportFile:
-                    yaml.dump(ModelConfig, ExportFile, default_flow_style=False)
+                FileData = yaml.dump(ModelConfig, Dumper=_YamlDumper, default_flow_style=False).encode('utf-8')
             else:
                 self.Logger.error(f"Unsupported export format: {FileExt}")
                 return False
             
+            _WriteFileAtomic(FilePath, FileData)
+            
             self.Logger.info(f"Model configuration exported to: {FilePath}")
             return True
             
@@ -590,11 +895,10 @@ class ConfigManager:
             FileExt = ConfigFile.suffix.lower()
             
             if FileExt == '.json':
-                with open(FilePath, 'r') as ImportFile:
-                    ModelConfig = json.load(ImportFile)
+                ModelConfig = _ReadJsonFile(FilePath)
             elif FileExt in ['.yaml', '.yml']:
                 with open(FilePath, 'r') as ImportFile:
-                    ModelConfig = yaml.safe_load(ImportFile)
+                    ModelConfig = yaml.load(ImportFile, Loader=_YamlLoader)
             else:
                 self.Logger.error(f"Unsupported import format: {FileExt}")
                 return False
@@ -627,27 +931,18 @@ class ConfigManager:
         Returns:
             bool: True if configuration is valid, False otherwise
         """
-        # Required parameters for valid model configuration
-        RequiredParams = ['Temperature', 'TopP', 'MaxTokens']
-        
-        # Check if all required parameters exist
-        for Param in RequiredParams:
-            if Param not in Config:
+        for Param, Types, MinValue, MaxValue, Message in _ModelConfigRules:
+            Value = Config.get(Param, _Missing)
+            
+            if Value is _Missing:
                 self.Logger.error(f"Missing required parameter: {Param}")
                 return False
-        
-        # Validate parameter types and ranges
-        if not isinstance(Config.get('Temperature'), (int, float)) or not 0 <= Config.get('Temperature') <= 2:
-            self.Logger.error("Temperature must be a number between 0 and 2")
-            return False
-        
-        if not isinstance(Config.get('TopP'), (int, float)) or not 0 <= Config.get('TopP') <= 1:
-            self.Logger.error("TopP must be a number between 0 and 1")
-            return False
-        
-        if not isinstance(Config.get('MaxTokens'), int) or Config.get('MaxTokens') <= 0:
-            self.Logger.error("MaxTokens must be a positive integer")
-            return False
+            
+            # bool is a subclass of int, so reject it explicitly
+            if (isinstance(Value, bool) or not isinstance(Value, Types)
+                    or Value < MinValue or (MaxValue is not None and Value > MaxValue)):
+                self.Logger.error(Message)
+                return False
         
         return True
     
@@ -666,32 +961,36 @@ class ConfigManager:
             return False
         
         try:
-            # Make sure configuration is loaded
-            self.LoadConfig()
+            # Make sure configuration is loaded, without re-parsing it if the caller already did
+            if not (self.AppConfig or self.UserPreferences or self.ModelConfigs):
+                self.LoadConfig()
             
             # Set database reference
             self.DB = DB
             
-            # Migrate application settings
-            self.Logger.info("Migrating application settings...")
-            for Key, Value in self.AppConfig.items():
-                DB.SetAppSetting(Key, Value)
-            
-            # Migrate user preferences
-            self.Logger.info("Migrating user preferences...")
-            for Key, Value in self.UserPreferences.items():
-                DB.SetUserPreference(Key, Value)
-            
-            # Migrate model configurations
-            self.Logger.info("Migrating model configurations...")
-            for ModelName, ModelConfig in self.ModelConfigs.items():
-                if isinstance(ModelConfig, dict) and not isinstance(list(ModelConfig.values())[0], dict):
-                    # This is a single configuration (not a dict of configs)
-                    DB.SaveModelConfig(ModelName, "Default", ModelConfig)
-                else:
-                    # This is a dict of configurations
-                    for ConfigName, ConfigParams in ModelConfig.items():
-                        DB.SaveModelConfig(ModelName, ConfigName, ConfigParams)
+            with DB.Transaction():
+                # Migrate application settings
+                self.Logger.info("Migrating application settings...")
+                DB.SetAppSettingsBulk(self.AppConfig.items())
+                
+                # Migrate user preferences
+                self.Logger.info("Migrating user preferences...")
+                DB.SetUserPreferencesBulk(self.UserPreferences.items())
+                
+                # Migrate model configurations
+                self.Logger.info("Migrating model configurations...")
+                Configs = []
+                for ModelName, ModelConfig in self.ModelConfigs.items():
+                    # Probe only the first value to tell a single config from a dict of configs
+                    FirstValue = next(iter(ModelConfig.values()), None) if isinstance(ModelConfig, dict) else None
+                    if isinstance(ModelConfig, dict) and not isinstance(FirstValue, dict):
+                        # This is a single configuration (not a dict of configs)
+                        Configs.append((ModelName, "Default", ModelConfig))
+                    else:
+                        # This is a dict of configurations
+                        Configs.extend((ModelName, ConfigName, ConfigParams) for ConfigName, ConfigParams in ModelConfig.items())
+                
+                DB.BulkSaveModelConfigs(Configs)
             
             self.Logger.info("Migration to database completed successfully")
             return True
@@ -2,17 +2,393 @@
 # Path: OllamaModelEditor/Core/DBManager.py
 # Standard: AIDEV-PascalCase-1.2
 # Created: 2025-03-12
-# Last Modified: 2025-03-12 08:30PM
+# Last Modified: 2026-10-15
 # Description: Database management for the OllamaModelEditor application
 
 import os
+import re
 import sqlite3
 import json
 import time
+import queue
+import atexit
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import Dict, List, Any, Optional, Union, Tuple, Iterable, Iterator, Callable
 import logging
 
+# Prefer orjson for JSON-typed values, falling back to the standard library
+try:
+    import orjson
+    
+    _JsonLoads = orjson.loads
+    
+    def _JsonDumps(Value: Any) -> str:
+        return orjson.dumps(Value, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+except ImportError:
+    _JsonLoads = json.loads
+    _JsonDumps = json.dumps
+
+# Decoders for values stored in the typed key/value tables, keyed by ValueType.
+# Numbers are stored natively, so only bools (0/1) and JSON need converting.
+_ValueConverters = {
+    "bool": bool,
+    "json": _JsonLoads
+}
+
+# Encoders for the typed key/value tables, keyed by exact Python type (bool before int)
+_ValueEncoders = {
+    bool: (int, "bool"),
+    int: (int, "int"),
+    float: (float, "float"),
+    dict: (_JsonDumps, "json"),
+    list: (_JsonDumps, "json")
+}
+
+_StringEncoder = (str, "string")
+
+# RETURNING lets an upsert hand back the row ID in the same statement (3.35+)
+_HasReturning = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+# Host parameters a single statement may bind (SQLITE_MAX_VARIABLE_NUMBER, raised in 3.32)
+_MaxVariables = 32766 if sqlite3.sqlite_version_info >= (3, 32, 0) else 999
+
+@lru_cache(maxsize=None)
+def _Placeholders(Count: int) -> str:
+    """Return a comma-separated list of Count '?' placeholders."""
+    return ",".join("?" * Count)
+
+# Current schema version (2: timestamps stored as INTEGER unix epoch seconds,
+# 3: typed key/value tables store int/float/bool values natively,
+# 4: BenchmarkResults indexed by ConfigID)
+_SchemaVersion = 4
+
+# Per-connection tuning; WAL makes fsyncs on commit unnecessary with synchronous=NORMAL,
+# and pooled connections on other threads wait out each other's write locks
+_ConnectionPragmas = """
+PRAGMA busy_timeout = 5000;
+PRAGMA synchronous = NORMAL;
+PRAGMA temp_store = MEMORY;
+PRAGMA cache_size = -20000;
+PRAGMA mmap_size = 268435456;
+"""
+
+# Schema for a new database; tables are created only if missing
+_SchemaSQL = """
+-- Database version
+CREATE TABLE IF NOT EXISTS DBVersion (
+    Version INTEGER PRIMARY KEY,
+    AppliedAt INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+);
+
+-- Model configurations
+CREATE TABLE IF NOT EXISTS ModelConfigs (
+    ID INTEGER PRIMARY KEY AUTOINCREMENT,
+    ModelName TEXT NOT NULL,
+    ConfigName TEXT NOT NULL,
+    Temperature REAL DEFAULT 0.7,
+    TopP REAL DEFAULT 0.9,
+    MaxTokens INTEGER DEFAULT 2048,
+    FrequencyPenalty REAL DEFAULT 0.0,
+    PresencePenalty REAL DEFAULT 0.0,
+    CreatedAt INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+    LastUsed INTEGER,
+    IsDefault BOOLEAN DEFAULT 0,
+    UNIQUE(ModelName, ConfigName)
+);
+
+-- Preset configurations
+CREATE TABLE IF NOT EXISTS Presets (
+    ID INTEGER PRIMARY KEY AUTOINCREMENT,
+    Name TEXT UNIQUE NOT NULL,
+    Description TEXT,
+    Temperature REAL DEFAULT 0.7,
+    TopP REAL DEFAULT 0.9,
+    MaxTokens INTEGER DEFAULT 2048,
+    FrequencyPenalty REAL DEFAULT 0.0,
+    PresencePenalty REAL DEFAULT 0.0,
+    CreatedAt INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+    LastUsed INTEGER
+);
+
+-- User-defined presets
+CREATE TABLE IF NOT EXISTS UserPresets (
+    ID INTEGER PRIMARY KEY AUTOINCREMENT,
+    Name TEXT UNIQUE NOT NULL,
+    Description TEXT,
+    Temperature REAL DEFAULT 0.7,
+    TopP REAL DEFAULT 0.9,
+    MaxTokens INTEGER DEFAULT 2048,
+    FrequencyPenalty REAL DEFAULT 0.0,
+    PresencePenalty REAL DEFAULT 0.0,
+    CreatedAt INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+    LastUsed INTEGER
+);
+
+-- User preferences
+CREATE TABLE IF NOT EXISTS UserPreferences (
+    Key TEXT PRIMARY KEY,
+    Value,
+    ValueType TEXT,
+    UpdatedAt INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+);
+
+-- Application settings
+CREATE TABLE IF NOT EXISTS AppSettings (
+    Key TEXT PRIMARY KEY,
+    Value,
+    ValueType TEXT,
+    Description TEXT,
+    UpdatedAt INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+);
+
+-- Parameter definitions and descriptions
+CREATE TABLE IF NOT EXISTS Parameters (
+    Name TEXT PRIMARY KEY,
+    DisplayName TEXT NOT NULL,
+    Description TEXT,
+    MinValue REAL,
+    MaxValue REAL,
+    DefaultValue REAL,
+    StepSize REAL,
+    IsInteger BOOLEAN DEFAULT 0,
+    Category TEXT,
+    OrderIndex INTEGER
+);
+
+-- Generation history
+CREATE TABLE IF NOT EXISTS GenerationHistory (
+    ID INTEGER PRIMARY KEY AUTOINCREMENT,
+    ModelName TEXT NOT NULL,
+    Prompt TEXT NOT NULL,
+    Response TEXT,
+    Temperature REAL,
+    TopP REAL,
+    MaxTokens INTEGER,
+    FrequencyPenalty REAL,
+    PresencePenalty REAL,
+    InputTokens INTEGER,
+    OutputTokens INTEGER,
+    TotalTokens INTEGER,
+    GenerationTime REAL,
+    CreatedAt INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+);
+
+-- Benchmark results
+CREATE TABLE IF NOT EXISTS BenchmarkResults (
+    ID INTEGER PRIMARY KEY AUTOINCREMENT,
+    BenchmarkName TEXT,
+    ModelName TEXT NOT NULL,
+    ConfigID INTEGER,
+    Prompt TEXT,
+    AverageTime REAL,
+    AverageTokens INTEGER,
+    AverageTokensPerSecond REAL,
+    Runs INTEGER,
+    CreatedAt INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+    FOREIGN KEY(ConfigID) REFERENCES ModelConfigs(ID)
+);
+
+-- Messages for UI elements
+CREATE TABLE IF NOT EXISTS UIMessages (
+    Key TEXT PRIMARY KEY,
+    Message TEXT NOT NULL,
+    Context TEXT,
+    UpdatedAt INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+);
+
+-- UI strings for internationalization
+CREATE TABLE IF NOT EXISTS UIStrings (
+    Key TEXT PRIMARY KEY,
+    EnText TEXT NOT NULL,
+    Description TEXT,
+    Context TEXT
+);
+
+-- Indexes for history and benchmark lookups (ModelConfigs lookups by
+-- ModelName are already served by its UNIQUE(ModelName, ConfigName) index)
+CREATE INDEX IF NOT EXISTS IX_GenerationHistory_CreatedAt ON GenerationHistory(CreatedAt);
+CREATE INDEX IF NOT EXISTS IX_GenerationHistory_ModelName ON GenerationHistory(ModelName, CreatedAt);
+CREATE INDEX IF NOT EXISTS IX_BenchmarkResults_ModelName ON BenchmarkResults(ModelName, CreatedAt);
+
+-- Benchmark lookups by configuration (and foreign key checks when a configuration is deleted)
+CREATE INDEX IF NOT EXISTS IX_BenchmarkResults_ConfigID ON BenchmarkResults(ConfigID);
+"""
+
+# Default rows seeded into empty tables
+_DefaultPresets = (
+    (
+        "Default", 
+        "Balanced settings suitable for most tasks.", 
+        0.7, 0.9, 2048, 0.0, 0.0
+    ),
+    (
+        "Creative", 
+        "Higher temperature and diversity for more creative, varied outputs.", 
+        1.0, 0.95, 4096, 0.0, 0.0
+    ),
+    (
+        "Precise", 
+        "Lower temperature for more focused, deterministic responses.", 
+        0.3, 0.7, 2048, 0.5, 0.0
+    ),
+    (
+        "Fast", 
+        "Optimized for speed with shorter outputs.", 
+        0.7, 0.9, 1024, 0.0, 0.0
+    ),
+    (
+        "Balanced", 
+        "Moderate settings with some repetition control for well-rounded responses.", 
+        0.6, 0.85, 2048, 0.3, 0.3
+    ),
+    (
+        "Deterministic", 
+        "Minimal randomness for highly predictable, consistent outputs.", 
+        0.0, 0.5, 2048, 0.0, 0.0
+    )
+)
+
+_DefaultParameters = (
+    (
+        "Temperature", "Temperature", 
+        "Controls randomness in text generation. Higher values (0.7-1.0) produce more creative outputs, while lower values (0.2-0.5) make output more focused and deterministic.",
+        0.0, 2.0, 0.7, 0.1, 0, "basic", 1
+    ),
+    (
+        "TopP", "Top-P",
+        "Controls diversity via nucleus sampling. Lower values make output more focused on likely tokens. 0.9 is a good starting point.",
+        0.0, 1.0, 0.9, 0.01, 0, "basic", 2
+    ),
+    (
+        "MaxTokens", "Max Tokens",
+        "The maximum length of the generated text. Higher values allow for longer responses but consume more resources.",
+        1, 32000, 2048, 1, 1, "basic", 3
+    ),
+    (
+        "FrequencyPenalty", "Frequency Penalty",
+        "Reduces repetition by penalizing tokens that have already appeared in the text. Higher values (0.5-1.0) strongly discourage repetition.",
+        0.0, 2.0, 0.0, 0.1, 0, "advanced", 4
+    ),
+    (
+        "PresencePenalty", "Presence Penalty",
+        "Penalizes tokens that have appeared at all, encouraging the model to discuss new topics. Useful for keeping responses diverse.",
+        0.0, 2.0, 0.0, 0.1, 0, "advanced", 5
+    )
+)
+
+_DefaultUIStrings = (
+    ("app.title", "Ollama Model Editor", "Main window title", "window"),
+    ("menu.file", "File", "File menu", "menu"),
+    ("menu.edit", "Edit", "Edit menu", "menu"),
+    ("menu.view", "View", "View menu", "menu"),
+    ("menu.tools", "Tools", "Tools menu", "menu"),
+    ("menu.help", "Help", "Help menu", "menu"),
+    ("button.apply", "Apply Changes", "Apply button", "button"),
+    ("button.reset", "Reset to Default", "Reset button", "button"),
+    ("error.no_model", "Please select a model first.", "Error message", "error"),
+    ("label.parameter_editor", "Parameter Editor", "Tab label", "tab"),
+    ("label.benchmark", "Benchmark", "Tab label", "tab"),
+    ("label.analysis", "Analysis", "Tab label", "tab"),
+    ("label.temperature", "Temperature:", "Parameter label", "parameter"),
+    ("label.top_p", "Top-P:", "Parameter label", "parameter"),
+    ("label.max_tokens", "Max Tokens:", "Parameter label", "parameter"),
+    ("label.frequency_penalty", "Frequency Penalty:", "Parameter label", "parameter"),
+    ("label.presence_penalty", "Presence Penalty:", "Parameter label", "parameter"),
+    ("label.model_library", "Model Library", "Dock title", "dock"),
+    ("label.presets", "Preset:", "Presets label", "parameter"),
+    ("label.available_models", "Available Models:", "Model list label", "label"),
+    ("status.loading_models", "Loading models...", "Status message", "status"),
+    ("status.models_loaded", "Loaded {0} models", "Status message", "status"),
+    ("status.model_selected", "Model {0} selected", "Status message", "status"),
+    ("status.api_connected", "API: Connected", "Status message", "status"),
+    ("status.api_error", "API: Error", "Status message", "status"),
+    ("status.no_connection", "API: Not connected", "Status message", "status")
+)
+
+# Shared by the single and batched generation history writers
+_InsertGenerationHistorySQL = """
+INSERT INTO GenerationHistory (
+    ModelName, Prompt, Response, Temperature, TopP, MaxTokens,
+    FrequencyPenalty, PresencePenalty, InputTokens, OutputTokens,
+    TotalTokens, GenerationTime)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Read queries built once, so every call passes the identical string that
+# sqlite3's statement cache is keyed on
+_SelectGenerationHistorySQL = """
+SELECT ID, ModelName, Prompt, Response, Temperature, TopP, MaxTokens,
+       FrequencyPenalty, PresencePenalty, InputTokens, OutputTokens,
+       TotalTokens, GenerationTime, CreatedAt
+FROM GenerationHistory
+"""
+
+# List views that don't show the prompt and response text skip decoding it
+_SelectGenerationHistorySummarySQL = """
+SELECT ID, ModelName, Temperature, TopP, MaxTokens,
+       FrequencyPenalty, PresencePenalty, InputTokens, OutputTokens,
+       TotalTokens, GenerationTime, CreatedAt
+FROM GenerationHistory
+"""
+
+_GenerationHistorySQL = _SelectGenerationHistorySQL + """
+ORDER BY CreatedAt DESC
+LIMIT ? OFFSET ?
+"""
+
+_GenerationHistoryForModelSQL = _SelectGenerationHistorySQL + """
+WHERE ModelName = ?
+ORDER BY CreatedAt DESC
+LIMIT ? OFFSET ?
+"""
+
+# Keyset pages compare on (CreatedAt, ID) so the order matches the CreatedAt indexes
+_AfterEntrySQL = "(CreatedAt, ID) < (SELECT CreatedAt, ID FROM GenerationHistory WHERE ID = ?)"
+_PageOrderSQL = """
+ORDER BY CreatedAt DESC, ID DESC
+LIMIT ?
+"""
+
+# Keyed by (filtered by model, continuing after an entry)
+_GenerationHistoryPageWhereSQL = {
+    (False, False): "",
+    (True, False): "WHERE ModelName = ?",
+    (False, True): f"WHERE {_AfterEntrySQL}",
+    (True, True): f"WHERE ModelName = ? AND {_AfterEntrySQL}"
+}
+
+# Keyed by (filtered by model, continuing after an entry, including prompt and response)
+_GenerationHistoryPageSQL = {
+    (ByModel, AfterEntry, IncludeText):
+        (_SelectGenerationHistorySQL if IncludeText else _SelectGenerationHistorySummarySQL) + WhereSQL + _PageOrderSQL
+    for (ByModel, AfterEntry), WhereSQL in _GenerationHistoryPageWhereSQL.items()
+    for IncludeText in (False, True)
+}
+
+_SelectBenchmarkResultsSQL = """
+SELECT b.ID, b.BenchmarkName, b.ModelName, b.ConfigID, b.Prompt,
+       b.AverageTime, b.AverageTokens, b.AverageTokensPerSecond, b.Runs,
+       b.CreatedAt,
+       c.Temperature, c.TopP, c.MaxTokens,
+       c.FrequencyPenalty, c.PresencePenalty
+FROM BenchmarkResults b
+JOIN ModelConfigs c ON b.ConfigID = c.ID
+"""
+
+_BenchmarkResultsSQL = _SelectBenchmarkResultsSQL + """
+ORDER BY b.CreatedAt DESC
+"""
+
+_BenchmarkResultsForModelSQL = _SelectBenchmarkResultsSQL + """
+WHERE b.ModelName = ?
+ORDER BY b.CreatedAt DESC
+"""
+
 class DBManager:
     """Manages the SQLite database for OllamaModelEditor."""
     
@@ -31,6 +407,37 @@ class DBManager:
         else:
             self.DBPath = DBPath
         
+        # Pooled connections, one per thread, reused until Close()
+        self._Connections: Dict[int, sqlite3.Connection] = {}
+        self._ConnectionsLock = threading.Lock()
+        
+        # Per-thread state (whether a transaction is active, and the tables whose
+        # cached rows it changed)
+        self._Local = threading.local()
+        
+        # Read-through caches for tables that rarely change after seeding, keyed by
+        # table: UI strings, parameter definitions and presets by name, and stored
+        # (Value, ValueType) pairs of the typed key/value tables. The lock keeps a
+        # fill on one thread from outliving a drop made by another.
+        self._TableCaches: Dict[str, Dict[str, Any]] = {}
+        self._CacheLock = threading.Lock()
+        
+        # Commits since the last WAL checkpoint
+        self._WriteCounter = 0
+        self._CheckpointEvery = 200
+        
+        # Write-behind queue for generation history, drained by a background
+        # thread in batches of up to _HistoryBatchSize rows
+        self._HistoryQueue: queue.Queue = queue.Queue()
+        self._HistoryWriter: Optional[threading.Thread] = None
+        self._HistoryWriterLock = threading.Lock()
+        self._HistoryBatchSize = 100
+        self._HistoryBatchWait = 0.05
+        
+        # Single worker for backups started with BackupDatabaseAsync and WAL checkpoints
+        self._BackgroundExecutor: Optional[ThreadPoolExecutor] = None
+        self._BackgroundExecutorLock = threading.Lock()
+        
         # Ensure directory exists
         os.makedirs(os.path.dirname(self.DBPath), exist_ok=True)
         
@@ -61,182 +468,20 @@ class DBManager:
     def _InitializeDB(self) -> None:
         """Initialize the database with required tables and default data."""
         try:
-            # Create schema definition
-            Schema = """
-            -- Database version
-            CREATE TABLE IF NOT EXISTS DBVersion (
-                Version INTEGER PRIMARY KEY,
-                AppliedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-            
-            -- Model configurations
-            CREATE TABLE IF NOT EXISTS ModelConfigs (
-                ID INTEGER PRIMARY KEY AUTOINCREMENT,
-                ModelName TEXT NOT NULL,
-                ConfigName TEXT NOT NULL,
-                Temperature REAL DEFAULT 0.7,
-                TopP REAL DEFAULT 0.9,
-                MaxTokens INTEGER DEFAULT 2048,
-                FrequencyPenalty REAL DEFAULT 0.0,
-                PresencePenalty REAL DEFAULT 0.0,
-                CreatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                LastUsed TIMESTAMP,
-                IsDefault BOOLEAN DEFAULT 0,
-                UNIQUE(ModelName, ConfigName)
-            );
-
-            -- Preset configurations
-            CREATE TABLE IF NOT EXISTS Presets (
-                ID INTEGER PRIMARY KEY AUTOINCREMENT,
-                Name TEXT UNIQUE NOT NULL,
-                Description TEXT,
-                Temperature REAL DEFAULT 0.7,
-                TopP REAL DEFAULT 0.9,
-                MaxTokens INTEGER DEFAULT 2048,
-                FrequencyPenalty REAL DEFAULT 0.0,
-                PresencePenalty REAL DEFAULT 0.0,
-                CreatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                LastUsed TIMESTAMP
-            );
-            
-            -- User-defined presets
-            CREATE TABLE IF NOT EXISTS UserPresets (
-                ID INTEGER PRIMARY KEY AUTOINCREMENT,
-                Name TEXT UNIQUE NOT NULL,
-                Description TEXT,
-                Temperature REAL DEFAULT 0.7,
-                TopP REAL DEFAULT 0.9,
-                MaxTokens INTEGER DEFAULT 2048,
-                FrequencyPenalty REAL DEFAULT 0.0,
-                PresencePenalty REAL DEFAULT 0.0,
-                CreatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                LastUsed TIMESTAMP
-            );
-            
-            -- User preferences
-            CREATE TABLE IF NOT EXISTS UserPreferences (
-                Key TEXT PRIMARY KEY,
-                Value TEXT,
-                ValueType TEXT,
-                UpdatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-            
-            -- Application settings
-            CREATE TABLE IF NOT EXISTS AppSettings (
-                Key TEXT PRIMARY KEY,
-                Value TEXT,
-                ValueType TEXT,
-                Description TEXT,
-                UpdatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-            
-            -- Parameter definitions and descriptions
-            CREATE TABLE IF NOT EXISTS Parameters (
-                Name TEXT PRIMARY KEY,
-                DisplayName TEXT NOT NULL,
-                Description TEXT,
-                MinValue REAL,
-                MaxValue REAL,
-                DefaultValue REAL,
-                StepSize REAL,
-                IsInteger BOOLEAN DEFAULT 0,
-                Category TEXT,
-                OrderIndex INTEGER
-            );
-            
-            -- Generation history
-            CREATE TABLE IF NOT EXISTS GenerationHistory (
-                ID INTEGER PRIMARY KEY AUTOINCREMENT,
-                ModelName TEXT NOT NULL,
-                Prompt TEXT NOT NULL,
-                Response TEXT,
-                Temperature REAL,
-                TopP REAL,
-                MaxTokens INTEGER,
-                FrequencyPenalty REAL,
-                PresencePenalty REAL,
-                InputTokens INTEGER,
-                OutputTokens INTEGER,
-                TotalTokens INTEGER,
-                GenerationTime REAL,
-                CreatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-            
-            -- Benchmark results
-            CREATE TABLE IF NOT EXISTS BenchmarkResults (
-                ID INTEGER PRIMARY KEY AUTOINCREMENT,
-                BenchmarkName TEXT,
-                ModelName TEXT NOT NULL,
-                ConfigID INTEGER,
-                Prompt TEXT,
-                AverageTime REAL,
-                AverageTokens INTEGER,
-                AverageTokensPerSecond REAL,
-                Runs INTEGER,
-                CreatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                FOREIGN KEY(ConfigID) REFERENCES ModelConfigs(ID)
-            );
-            
-            -- Messages for UI elements
-            CREATE TABLE IF NOT EXISTS UIMessages (
-                Key TEXT PRIMARY KEY,
-                Message TEXT NOT NULL,
-                Context TEXT,
-                UpdatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-            
-            -- UI strings for internationalization
-            CREATE TABLE IF NOT EXISTS UIStrings (
-                Key TEXT PRIMARY KEY,
-                EnText TEXT NOT NULL,
-                Description TEXT,
-                Context TEXT
-            );
-            """
-            
             # Connect to database
-            with sqlite3.connect(self.DBPath) as Conn:
+            with self.GetConnection() as Conn:
                 Cursor = Conn.cursor()
                 
-                # Execute schema script
-                Cursor.executescript(Schema)
-                
-                # Check current database version
-                Cursor.execute("SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name='DBVersion'")
-                if Cursor.fetchone()[0] > 0:
-                    Cursor.execute("SELECT MAX(Version) FROM DBVersion")
-                    Result = Cursor.fetchone()
-                    CurrentVersion = Result[0] if Result[0] is not None else 0
-                else:
-                    CurrentVersion = 0
-                
-                # Set initial version if it doesn't exist
-                if CurrentVersion == 0:
-                    Cursor.execute("INSERT INTO DBVersion (Version) VALUES (1)")
-                    CurrentVersion = 1
-                
-                # Check if presets need to be initialized
-                Cursor.execute("SELECT COUNT(*) FROM Presets")
-                PresetCount = Cursor.fetchone()[0]
-                
-                if PresetCount == 0:
-                    self._InitializePresets(Cursor)
-                
-                # Check if parameters need to be initialized
-                Cursor.execute("SELECT COUNT(*) FROM Parameters")
-                ParameterCount = Cursor.fetchone()[0]
-                
-                if ParameterCount == 0:
-                    self._InitializeParameters(Cursor)
+                # Persistent settings: auto_vacuum only applies before the first table
+                # is created, and WAL mode sticks to the database file once set
+                Cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                Cursor.execute("PRAGMA journal_mode = WAL")
                 
-                # Check if UI strings need to be initialized
-                Cursor.execute("SELECT COUNT(*) FROM UIStrings")
-                UIStringCount = Cursor.fetchone()[0]
+                self._MigrateSchema(Cursor)
                 
-                if UIStringCount == 0:
-                    self._InitializeUIStrings(Cursor)
-                
-                Conn.commit()
+                # Analyze every table once at startup so plans are sound right after
+                # a migration; later runs only revisit tables whose stats went stale
+                Cursor.execute("PRAGMA optimize = 0x10002")
                 
             self.Logger.info(f"Database initialized: {self.DBPath}")
                 
@@ -244,53 +489,199 @@ class DBManager:
             self.Logger.error(f"Error initializing database: {Error}")
             raise
     
-    def _InitializePresets(self, Cursor) -> None:
+    def _MigrateSchema(self, Cursor) -> None:
         """
-        Initialize default presets.
+        Bring the database up to the current schema version.
         
         Args:
             Cursor: Database cursor
         """
-        Presets = [
-            (
-                "Default", 
-                "Balanced settings suitable for most tasks.", 
-                0.7, 0.9, 2048, 0.0, 0.0
-            ),
-            (
-                "Creative", 
-                "Higher temperature and diversity for more creative, varied outputs.", 
-                1.0, 0.95, 4096, 0.0, 0.0
-            ),
-            (
-                "Precise", 
-                "Lower temperature for more focused, deterministic responses.", 
-                0.3, 0.7, 2048, 0.5, 0.0
-            ),
-            (
-                "Fast", 
-                "Optimized for speed with shorter outputs.", 
-                0.7, 0.9, 1024, 0.0, 0.0
-            ),
-            (
-                "Balanced", 
-                "Moderate settings with some repetition control for well-rounded responses.", 
-                0.6, 0.85, 2048, 0.3, 0.3
-            ),
-            (
-                "Deterministic", 
-                "Minimal randomness for highly predictable, consistent outputs.", 
-                0.0, 0.5, 2048, 0.0, 0.0
+        # Upgrade databases created with an older schema before applying the current one
+        StoredVersion = 0
+        Cursor.execute("SELECT EXISTS(SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'DBVersion')")
+        if Cursor.fetchone()[0]:
+            Cursor.execute("SELECT COALESCE(MAX(Version), 0) FROM DBVersion")
+            StoredVersion = Cursor.fetchone()[0]
+            
+            if 0 < StoredVersion < 2:
+                self._MigrateToEpochTimestamps(Cursor)
+            
+            if 0 < StoredVersion < 3:
+                self._MigrateToNativeValues(Cursor)
+        
+        # A database already at the current version has every table, index
+        # and seed row, so the schema script only runs for new or older files
+        if StoredVersion < _SchemaVersion:
+            self._ApplySchema(Cursor)
+        
+        self._EnableIncrementalVacuum(Cursor)
+    
+    def _EnableIncrementalVacuum(self, Cursor) -> None:
+        """
+        Switch a database created without auto_vacuum to incremental mode.
+        
+        Setting the pragma only takes effect on a file that has no tables yet;
+        an existing file needs one full VACUUM before incremental_vacuum can
+        release pages. Files already in incremental mode are left alone.
+        
+        Args:
+            Cursor: Database cursor (outside a transaction)
+        """
+        Cursor.execute("PRAGMA auto_vacuum")
+        if Cursor.fetchone()[0] == 2:
+            return
+        
+        Cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        Cursor.execute("VACUUM")
+        
+        self.Logger.info("Database rebuilt for incremental vacuum")
+    
+    def _ApplySchema(self, Cursor) -> None:
+        """
+        Create missing tables and indexes, seed empty tables and record the schema version.
+        
+        Args:
+            Cursor: Database cursor
+        """
+        # Execute schema script
+        Cursor.executescript(_SchemaSQL)
+        
+        # Probe and seed under one write lock so the first run commits (and syncs)
+        # once, and concurrent instances can't both seed the same tables
+        Cursor.execute("BEGIN IMMEDIATE")
+        
+        # Check the database version and which tables need seeding in one query
+        # (the schema script guarantees every table exists)
+        Cursor.execute(
+            """
+            SELECT COALESCE((SELECT MAX(Version) FROM DBVersion), 0),
+                   EXISTS(SELECT 1 FROM Presets),
+                   EXISTS(SELECT 1 FROM Parameters),
+                   EXISTS(SELECT 1 FROM UIStrings)
+            """
+        )
+        CurrentVersion, HasPresets, HasParameters, HasUIStrings = Cursor.fetchone()
+        
+        # Record the current version for new databases and schema-only upgrades
+        if CurrentVersion < _SchemaVersion:
+            Cursor.execute("INSERT INTO DBVersion (Version) VALUES (?)", (_SchemaVersion,))
+        
+        # Seed any empty tables
+        if not HasPresets:
+            self._InitializePresets(Cursor)
+        
+        if not HasParameters:
+            self._InitializeParameters(Cursor)
+        
+        if not HasUIStrings:
+            self._InitializeUIStrings(Cursor)
+        
+        Cursor.execute("COMMIT")
+    
+    def _MigrateToEpochTimestamps(self, Cursor) -> None:
+        """
+        Rebuild version 1 tables so timestamps are stored as INTEGER epoch seconds.
+        
+        Column defaults can't be altered in place, so each table with TIMESTAMP
+        columns is recreated with INTEGER columns and its rows are copied over,
+        converting the stored ISO-8601 text.
+        
+        Args:
+            Cursor: Database cursor
+        """
+        Cursor.execute("BEGIN IMMEDIATE")
+        
+        Cursor.execute("SELECT name, sql FROM sqlite_master WHERE type = 'table' AND sql LIKE '%TIMESTAMP%'")
+        for TableName, TableSQL in Cursor.fetchall():
+            NewSQL = TableSQL.replace(
+                'TIMESTAMP DEFAULT CURRENT_TIMESTAMP', "INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))"
             )
-        ]
+            NewSQL = re.sub(r'\bTIMESTAMP\b', 'INTEGER', NewSQL)
+            
+            self._RebuildTable(
+                Cursor, TableName, NewSQL,
+                lambda Name, Type: f"CASE WHEN typeof({Name}) = 'text' THEN CAST(strftime('%s', {Name}) AS INTEGER) ELSE {Name} END"
+                if Type == 'TIMESTAMP' else Name
+            )
+        
+        Cursor.execute("INSERT INTO DBVersion (Version) VALUES (2)")
+        Cursor.execute("COMMIT")
+        
+        self.Logger.info("Database migrated to schema version 2")
+    
+    def _MigrateToNativeValues(self, Cursor) -> None:
+        """
+        Rebuild version 2 key/value tables so values keep their SQLite storage class.
+        
+        The Value column loses its TEXT affinity, and stored int, float and bool
+        values are converted from their text form so reads need no parsing.
+        
+        Args:
+            Cursor: Database cursor
+        """
+        Cursor.execute("BEGIN IMMEDIATE")
+        
+        Cursor.execute(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'table' AND name IN ('UserPreferences', 'AppSettings')"
+        )
+        for TableName, TableSQL in Cursor.fetchall():
+            self._RebuildTable(
+                Cursor, TableName, re.sub(r'\bValue TEXT\b', 'Value', TableSQL),
+                lambda Name, Type: (
+                    "CASE ValueType WHEN 'int' THEN CAST(Value AS INTEGER) "
+                    "WHEN 'float' THEN CAST(Value AS REAL) "
+                    "WHEN 'bool' THEN lower(Value) IN ('true', '1', 'yes') ELSE Value END"
+                ) if Name == 'Value' else Name
+            )
+        
+        Cursor.execute("INSERT INTO DBVersion (Version) VALUES (3)")
+        Cursor.execute("COMMIT")
         
+        self.Logger.info("Database migrated to schema version 3")
+    
+    def _RebuildTable(self, Cursor, TableName: str, NewSQL: str, ColumnExpression) -> None:
+        """
+        Recreate a table from a new definition, copying its rows across.
+        
+        SQLite can't change a column's type or default in place, so the table is
+        created under a temporary name, filled, and renamed over the original.
+        
+        Args:
+            Cursor: Database cursor (inside an open transaction)
+            TableName: Table to rebuild
+            NewSQL: CREATE TABLE statement for the new definition
+            ColumnExpression: Callable (column name, declared type) -> SELECT expression
+        """
+        Cursor.execute(f"PRAGMA table_info({TableName})")
+        Columns = [(Row[1], Row[2].upper()) for Row in Cursor.fetchall()]
+        
+        ColumnList = ', '.join(Name for Name, _ in Columns)
+        SelectList = ', '.join(ColumnExpression(Name, Type) for Name, Type in Columns)
+        
+        # Keep foreign key references in other tables pointing at the original name
+        Cursor.execute("PRAGMA legacy_alter_table = ON")
+        
+        Cursor.execute(re.sub(rf'\b{TableName}\b', f'{TableName}_New', NewSQL, count=1))
+        Cursor.execute(f"INSERT INTO {TableName}_New ({ColumnList}) SELECT {SelectList} FROM {TableName}")
+        Cursor.execute(f"DROP TABLE {TableName}")
+        Cursor.execute(f"ALTER TABLE {TableName}_New RENAME TO {TableName}")
+        
+        Cursor.execute("PRAGMA legacy_alter_table = OFF")
+    
+    def _InitializePresets(self, Cursor) -> None:
+        """
+        Initialize default presets.
+        
+        Args:
+            Cursor: Database cursor
+        """
         Cursor.executemany(
             """
             INSERT INTO Presets (Name, Description, Temperature, TopP, MaxTokens, 
                                FrequencyPenalty, PresencePenalty)
             VALUES (?, ?, ?, ?, ?, ?, ?)
             """, 
-            Presets
+            _DefaultPresets
         )
     
     def _InitializeParameters(self, Cursor) -> None:
@@ -300,41 +691,13 @@ class DBManager:
         Args:
             Cursor: Database cursor
         """
-        Parameters = [
-            (
-                "Temperature", "Temperature", 
-                "Controls randomness in text generation. Higher values (0.7-1.0) produce more creative outputs, while lower values (0.2-0.5) make output more focused and deterministic.",
-                0.0, 2.0, 0.7, 0.1, 0, "basic", 1
-            ),
-            (
-                "TopP", "Top-P",
-                "Controls diversity via nucleus sampling. Lower values make output more focused on likely tokens. 0.9 is a good starting point.",
-                0.0, 1.0, 0.9, 0.01, 0, "basic", 2
-            ),
-            (
-                "MaxTokens", "Max Tokens",
-                "The maximum length of the generated text. Higher values allow for longer responses but consume more resources.",
-                1, 32000, 2048, 1, 1, "basic", 3
-            ),
-            (
-                "FrequencyPenalty", "Frequency Penalty",
-                "Reduces repetition by penalizing tokens that have already appeared in the text. Higher values (0.5-1.0) strongly discourage repetition.",
-                0.0, 2.0, 0.0, 0.1, 0, "advanced", 4
-            ),
-            (
-                "PresencePenalty", "Presence Penalty",
-                "Penalizes tokens that have appeared at all, encouraging the model to discuss new topics. Useful for keeping responses diverse.",
-                0.0, 2.0, 0.0, 0.1, 0, "advanced", 5
-            )
-        ]
-        
         Cursor.executemany(
             """
             INSERT INTO Parameters (Name, DisplayName, Description, MinValue, MaxValue, 
                                  DefaultValue, StepSize, IsInteger, Category, OrderIndex)
             VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, 
-            Parameters
+            _DefaultParameters
         )
     
     def _InitializeUIStrings(self, Cursor) -> None:
@@ -344,52 +707,157 @@ class DBManager:
         Args:
             Cursor: Database cursor
         """
-        # Example UI strings initialization
-        UIStrings = [
-            ("app.title", "Ollama Model Editor", "Main window title", "window"),
-            ("menu.file", "File", "File menu", "menu"),
-            ("menu.edit", "Edit", "Edit menu", "menu"),
-            ("menu.view", "View", "View menu", "menu"),
-            ("menu.tools", "Tools", "Tools menu", "menu"),
-            ("menu.help", "Help", "Help menu", "menu"),
-            ("button.apply", "Apply Changes", "Apply button", "button"),
-            ("button.reset", "Reset to Default", "Reset button", "button"),
-            ("error.no_model", "Please select a model first.", "Error message", "error"),
-            ("label.parameter_editor", "Parameter Editor", "Tab label", "tab"),
-            ("label.benchmark", "Benchmark", "Tab label", "tab"),
-            ("label.analysis", "Analysis", "Tab label", "tab"),
-            ("label.temperature", "Temperature:", "Parameter label", "parameter"),
-            ("label.top_p", "Top-P:", "Parameter label", "parameter"),
-            ("label.max_tokens", "Max Tokens:", "Parameter label", "parameter"),
-            ("label.frequency_penalty", "Frequency Penalty:", "Parameter label", "parameter"),
-            ("label.presence_penalty", "Presence Penalty:", "Parameter label", "parameter"),
-            ("label.model_library", "Model Library", "Dock title", "dock"),
-            ("label.presets", "Preset:", "Presets label", "parameter"),
-            ("label.available_models", "Available Models:", "Model list label", "label"),
-            ("status.loading_models", "Loading models...", "Status message", "status"),
-            ("status.models_loaded", "Loaded {0} models", "Status message", "status"),
-            ("status.model_selected", "Model {0} selected", "Status message", "status"),
-            ("status.api_connected", "API: Connected", "Status message", "status"),
-            ("status.api_error", "API: Error", "Status message", "status"),
-            ("status.no_connection", "API: Not connected", "Status message", "status")
-        ]
-        
         Cursor.executemany(
             """
             INSERT INTO UIStrings (Key, EnText, Description, Context)
             VALUES (?, ?, ?, ?)
             """, 
-            UIStrings
+            _DefaultUIStrings
         )
     
     def GetConnection(self) -> sqlite3.Connection:
         """
-        Get a database connection.
+        Get the calling thread's pooled database connection.
+        
+        The connection is opened on first use and kept for later calls, so it
+        must not be closed by callers; use Close() to release all connections.
         
         Returns:
             sqlite3.Connection: Database connection
         """
-        return sqlite3.connect(self.DBPath)
+        ThreadID = threading.get_ident()
+        Conn = self._Connections.get(ThreadID)
+        
+        if Conn is None:
+            # Pooled connections live long enough for a larger statement cache to pay off.
+            # Implicit transactions start with BEGIN IMMEDIATE, so a write takes the
+            # lock up front (waiting out busy_timeout) instead of failing on upgrade
+            Conn = sqlite3.connect(
+                self.DBPath, check_same_thread=False, cached_statements=256, isolation_level="IMMEDIATE"
+            )
+            Conn.executescript(_ConnectionPragmas)
+            Conn.row_factory = sqlite3.Row
+            
+            with self._ConnectionsLock:
+                self._Connections[ThreadID] = Conn
+        
+        return Conn
+    
+    def Close(self) -> None:
+        """
+        Close all pooled database connections.
+        
+        Each connection runs PRAGMA optimize first, so the query planner
+        statistics reflect the queries that connection actually issued.
+        Queued generation history, pending backups and checkpoints are finished first.
+        """
+        self._StopHistoryWriter()
+        
+        with self._BackgroundExecutorLock:
+            Executor, self._BackgroundExecutor = self._BackgroundExecutor, None
+        if Executor is not None:
+            Executor.shutdown(wait=True)
+        
+        with self._ConnectionsLock:
+            Connections = list(self._Connections.values())
+            self._Connections.clear()
+        
+        for Conn in Connections:
+            try:
+                Conn.execute("PRAGMA optimize")
+            except sqlite3.Error as Error:
+                self.Logger.warning(f"Error optimizing database connection: {Error}")
+            
+            try:
+                Conn.close()
+            except sqlite3.Error as Error:
+                self.Logger.warning(f"Error closing database connection: {Error}")
+    
+    @contextmanager
+    def Transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Group several statements into a single transaction.
+        
+        Queries issued on the same thread inside the block share one connection
+        and are committed together on exit (rolled back on error). Nested blocks
+        join the outer transaction.
+        
+        Yields:
+            sqlite3.Connection: Connection used for the transaction
+        """
+        Conn = self.GetConnection()
+        
+        if getattr(self._Local, 'InTransaction', False):
+            yield Conn
+            return
+        
+        self._Local.InTransaction = True
+        self._Local.StaleTables = set()
+        
+        try:
+            # Begin explicitly so reads and DDL in the block are covered too
+            if not Conn.in_transaction:
+                Conn.execute("BEGIN IMMEDIATE")
+            
+            with Conn:
+                yield Conn
+        finally:
+            self._Local.InTransaction = False
+            
+            # Committed or rolled back, drop caches the block wrote to once more
+            for Table in self._Local.StaleTables:
+                self._DropTableCache(Table)
+        
+        self._CountWrite()
+    
+    def _CountWrite(self) -> None:
+        """
+        Count a committed write and periodically truncate the WAL file.
+        
+        Open readers can keep SQLite's automatic passive checkpoints from
+        finishing, so the WAL would otherwise grow for the whole session.
+        A truncating checkpoint waits out readers and writers (up to the busy
+        timeout), so it runs on the background worker rather than on the
+        thread that committed, which is usually the UI thread.
+        """
+        self._WriteCounter += 1
+        if self._WriteCounter < self._CheckpointEvery:
+            return
+        
+        self._WriteCounter = 0
+        self._SubmitBackground(self._CheckpointWAL)
+    
+    def _CheckpointWAL(self) -> None:
+        """Checkpoint and truncate the WAL file on the calling thread's connection."""
+        try:
+            Busy, LogFrames, CheckpointedFrames = self.GetConnection().execute(
+                "PRAGMA wal_checkpoint(TRUNCATE)"
+            ).fetchone()
+        except sqlite3.Error as Error:
+            self.Logger.warning(f"Error checkpointing WAL: {Error}")
+            return
+        
+        if Busy:
+            self.Logger.warning(
+                f"WAL checkpoint incomplete: {CheckpointedFrames} of {LogFrames} frames checkpointed"
+            )
+    
+    def _SubmitBackground(self, Function: Callable, *Args: Any) -> Future:
+        """
+        Run a function on the single background worker, starting it on first use.
+        
+        Args:
+            Function: Function to run
+            *Args: Arguments for the function
+            
+        Returns:
+            Future for the function's result
+        """
+        with self._BackgroundExecutorLock:
+            if self._BackgroundExecutor is None:
+                self._BackgroundExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="DBBackground")
+            
+            return self._BackgroundExecutor.submit(Function, *Args)
     
     def ExecuteQuery(self, Query: str, Params: tuple = ()) -> List[tuple]:
         """
@@ -403,15 +871,52 @@ class DBManager:
             List of result tuples
         """
         try:
-            with self.GetConnection() as Conn:
-                Cursor = Conn.cursor()
-                Cursor.execute(Query, Params)
-                return Cursor.fetchall()
+            return self.GetConnection().execute(Query, Params).fetchall()
         except sqlite3.Error as Error:
             self.Logger.error(f"Error executing query: {Error}")
-            self.Logger.debug(f"Query: {Query}, Params: {Params}")
+            self.Logger.debug("Query: %s, Params: %s", Query, Params)
             raise
     
+    def ExecuteQueryIter(self, Query: str, Params: tuple = ()) -> Iterator[sqlite3.Row]:
+        """
+        Execute a query and yield result rows as they are fetched.
+        
+        Unlike ExecuteQuery, the full result set is never materialized as a list.
+        
+        Args:
+            Query: SQL query
+            Params: Query parameters
+            
+        Yields:
+            Result rows
+        """
+        try:
+            yield from self.GetConnection().execute(Query, Params)
+        except sqlite3.Error as Error:
+            self.Logger.error(f"Error executing query: {Error}")
+            self.Logger.debug("Query: %s, Params: %s", Query, Params)
+            raise
+    
+    def ExecuteScalar(self, Query: str, Params: tuple = ()) -> Any:
+        """
+        Execute a query and return the first column of its first row.
+        
+        Args:
+            Query: SQL query
+            Params: Query parameters
+            
+        Returns:
+            First value, or None if the query returned no rows
+        """
+        try:
+            Row = self.GetConnection().execute(Query, Params).fetchone()
+        except sqlite3.Error as Error:
+            self.Logger.error(f"Error executing query: {Error}")
+            self.Logger.debug("Query: %s, Params: %s", Query, Params)
+            raise
+        
+        return Row[0] if Row else None
+    
     def ExecuteNonQuery(self, Query: str, Params: tuple = ()) -> int:
         """
         Execute a non-query statement.
@@ -423,17 +928,57 @@ class DBManager:
         Returns:
             Row count or last row ID
         """
+        Conn = self.GetConnection()
+        
         try:
-            with self.GetConnection() as Conn:
-                Cursor = Conn.cursor()
-                Cursor.execute(Query, Params)
+            Cursor = Conn.execute(Query, Params)
+            
+            # Inside a transaction the commit happens when the block exits
+            if not getattr(self._Local, 'InTransaction', False):
                 Conn.commit()
-                return Cursor.lastrowid or Cursor.rowcount
+                self._CountWrite()
+            
+            # A pooled connection's lastrowid still reports its most recent insert
+            # after an UPDATE or DELETE, so only inserts return it
+            if Query.lstrip()[:7].upper().startswith(("INSERT", "REPLACE")):
+                return Cursor.lastrowid
+            
+            return Cursor.rowcount
         except sqlite3.Error as Error:
+            # Don't leave a failed statement's implicit transaction open on the pooled connection
+            if not getattr(self._Local, 'InTransaction', False):
+                Conn.rollback()
+            
             self.Logger.error(f"Error executing non-query: {Error}")
-            self.Logger.debug(f"Query: {Query}, Params: {Params}")
+            self.Logger.debug("Query: %s, Params: %s", Query, Params)
             raise
     
+    def _UpsertReturningID(self, Conn: sqlite3.Connection, UpsertSQL: str, Params: tuple,
+                           LookupSQL: str, LookupParams: tuple) -> int:
+        """
+        Run an INSERT ... ON CONFLICT DO UPDATE and return the affected row's ID.
+        
+        SQLite 3.35+ returns the ID from the upsert itself. Older builds have no
+        RETURNING, and lastrowid isn't set when the conflict branch updates, so
+        the ID is looked up by the row's unique key instead.
+        
+        Args:
+            Conn: Connection inside an open transaction
+            UpsertSQL: Upsert statement without a RETURNING clause
+            Params: Upsert parameters
+            LookupSQL: Query selecting the row's ID by its unique key
+            LookupParams: Lookup parameters
+            
+        Returns:
+            Row ID of the inserted or updated row
+        """
+        if _HasReturning:
+            # Fetch every row so the statement is finished before the commit
+            return Conn.execute(UpsertSQL + " RETURNING ID", Params).fetchall()[0][0]
+        
+        Conn.execute(UpsertSQL, Params)
+        return Conn.execute(LookupSQL, LookupParams).fetchone()[0]
+    
     # Model Configuration Methods
     
     def GetModelConfigs(self, ModelName: str) -> List[Dict[str, Any]]:
@@ -446,18 +991,17 @@ class DBManager:
         Returns:
             List of configuration dictionaries
         """
-        Results = self.ExecuteQuery(
-            "SELECT * FROM ModelConfigs WHERE ModelName = ?",
+        Results = self.ExecuteQueryIter(
+            """
+            SELECT ID, ModelName, ConfigName, Temperature, TopP, MaxTokens,
+                   FrequencyPenalty, PresencePenalty, CreatedAt, LastUsed, IsDefault
+            FROM ModelConfigs
+            WHERE ModelName = ?
+            """,
             (ModelName,)
         )
         
-        Columns = [
-            "ID", "ModelName", "ConfigName", "Temperature", "TopP", 
-            "MaxTokens", "FrequencyPenalty", "PresencePenalty", 
-            "CreatedAt", "LastUsed", "IsDefault"
-        ]
-        
-        return [dict(zip(Columns, Row)) for Row in Results]
+        return [dict(Row) for Row in Results]
     
     def GetModelConfig(self, ModelName: str, ConfigName: str = "Default") -> Optional[Dict[str, Any]]:
         """
@@ -471,20 +1015,19 @@ class DBManager:
             Configuration dictionary or None if not found
         """
         Results = self.ExecuteQuery(
-            "SELECT * FROM ModelConfigs WHERE ModelName = ? AND ConfigName = ?",
+            """
+            SELECT ID, ModelName, ConfigName, Temperature, TopP, MaxTokens,
+                   FrequencyPenalty, PresencePenalty, CreatedAt, LastUsed, IsDefault
+            FROM ModelConfigs
+            WHERE ModelName = ? AND ConfigName = ?
+            """,
             (ModelName, ConfigName)
         )
         
         if not Results:
             return None
         
-        Columns = [
-            "ID", "ModelName", "ConfigName", "Temperature", "TopP", 
-            "MaxTokens", "FrequencyPenalty", "PresencePenalty", 
-            "CreatedAt", "LastUsed", "IsDefault"
-        ]
-        
-        return dict(zip(Columns, Results[0]))
+        return dict(Results[0])
     
     def SaveModelConfig(self, ModelName: str, ConfigName: str, Params: Dict[str, Any]) -> int:
         """
@@ -498,44 +1041,22 @@ class DBManager:
         Returns:
             Row ID of the saved configuration
         """
-        # Check if configuration exists
-        ExistingConfig = self.GetModelConfig(ModelName, ConfigName)
-        
-        if ExistingConfig:
-            # Update existing configuration
-            Query = """
-            UPDATE ModelConfigs
-            SET Temperature = ?, TopP = ?, MaxTokens = ?, 
-                FrequencyPenalty = ?, PresencePenalty = ?,
-                LastUsed = CURRENT_TIMESTAMP
-            WHERE ModelName = ? AND ConfigName = ?
-            """
-            
-            self.ExecuteNonQuery(
-                Query,
-                (
-                    Params.get('Temperature', 0.7),
-                    Params.get('TopP', 0.9),
-                    Params.get('MaxTokens', 2048),
-                    Params.get('FrequencyPenalty', 0.0),
-                    Params.get('PresencePenalty', 0.0),
-                    ModelName,
-                    ConfigName
-                )
-            )
-            
-            return ExistingConfig["ID"]
-        else:
-            # Insert new configuration
-            Query = """
-            INSERT INTO ModelConfigs
-            (ModelName, ConfigName, Temperature, TopP, MaxTokens, 
-             FrequencyPenalty, PresencePenalty)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """
-            
-            return self.ExecuteNonQuery(
-                Query,
+        # Insert or update, returning the row ID either way
+        with self.Transaction() as Conn:
+            return self._UpsertReturningID(
+                Conn,
+                """
+                INSERT INTO ModelConfigs
+                (ModelName, ConfigName, Temperature, TopP, MaxTokens, 
+                 FrequencyPenalty, PresencePenalty)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(ModelName, ConfigName) DO UPDATE
+                SET Temperature = excluded.Temperature, TopP = excluded.TopP,
+                    MaxTokens = excluded.MaxTokens,
+                    FrequencyPenalty = excluded.FrequencyPenalty,
+                    PresencePenalty = excluded.PresencePenalty,
+                    LastUsed = CAST(strftime('%s', 'now') AS INTEGER)
+                """,
                 (
                     ModelName,
                     ConfigName,
@@ -544,7 +1065,46 @@ class DBManager:
                     Params.get('MaxTokens', 2048),
                     Params.get('FrequencyPenalty', 0.0),
                     Params.get('PresencePenalty', 0.0)
-                )
+                ),
+                "SELECT ID FROM ModelConfigs WHERE ModelName = ? AND ConfigName = ?",
+                (ModelName, ConfigName)
+            )
+    
+    def BulkSaveModelConfigs(self, Configs: Iterable[Tuple[str, str, Dict[str, Any]]]) -> None:
+        """
+        Save several model configurations with a single batched statement.
+        
+        Args:
+            Configs: Iterable of (model name, configuration name, parameters) tuples
+        """
+        Rows = [
+            (
+                ModelName,
+                ConfigName,
+                Params.get('Temperature', 0.7),
+                Params.get('TopP', 0.9),
+                Params.get('MaxTokens', 2048),
+                Params.get('FrequencyPenalty', 0.0),
+                Params.get('PresencePenalty', 0.0)
+            )
+            for ModelName, ConfigName, Params in Configs
+        ]
+        
+        with self.Transaction() as Conn:
+            Conn.executemany(
+                """
+                INSERT INTO ModelConfigs
+                (ModelName, ConfigName, Temperature, TopP, MaxTokens, 
+                 FrequencyPenalty, PresencePenalty)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(ModelName, ConfigName) DO UPDATE
+                SET Temperature = excluded.Temperature, TopP = excluded.TopP,
+                    MaxTokens = excluded.MaxTokens,
+                    FrequencyPenalty = excluded.FrequencyPenalty,
+                    PresencePenalty = excluded.PresencePenalty,
+                    LastUsed = CAST(strftime('%s', 'now') AS INTEGER)
+                """,
+                Rows
             )
     
     def DeleteModelConfig(self, ModelName: str, ConfigName: str) -> bool:
@@ -567,6 +1127,27 @@ class DBManager:
     
     # Preset Methods
     
+    def _GetPresetsCache(self, Table: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the presets in a preset table keyed by name, loading them on first use.
+        
+        Args:
+            Table: Table name (Presets or UserPresets)
+            
+        Returns:
+            Dictionary of preset dictionaries in name order
+        """
+        return self._GetTableCache(Table, lambda: {
+            Row['Name']: dict(Row) for Row in self.ExecuteQueryIter(
+                f"""
+                SELECT ID, Name, Description, Temperature, TopP, MaxTokens,
+                       FrequencyPenalty, PresencePenalty, CreatedAt, LastUsed
+                FROM {Table}
+                ORDER BY Name
+                """
+            )
+        })
+    
     def GetPresets(self) -> List[Dict[str, Any]]:
         """
         Get all preset configurations.
@@ -574,15 +1155,8 @@ class DBManager:
         Returns:
             List of preset dictionaries
         """
-        Results = self.ExecuteQuery("SELECT * FROM Presets ORDER BY Name")
-        
-        Columns = [
-            "ID", "Name", "Description", "Temperature", "TopP", 
-            "MaxTokens", "FrequencyPenalty", "PresencePenalty", 
-            "CreatedAt", "LastUsed"
-        ]
-        
-        return [dict(zip(Columns, Row)) for Row in Results]
+        # Copies keep callers from modifying the cached presets
+        return [dict(Preset) for Preset in self._GetPresetsCache("Presets").values()]
     
     def GetPreset(self, PresetName: str) -> Optional[Dict[str, Any]]:
         """
@@ -594,21 +1168,12 @@ class DBManager:
         Returns:
             Preset dictionary or None if not found
         """
-        Results = self.ExecuteQuery(
-            "SELECT * FROM Presets WHERE Name = ?",
-            (PresetName,)
-        )
+        Preset = self._GetPresetsCache("Presets").get(PresetName)
         
-        if not Results:
+        if Preset is None:
             return None
         
-        Columns = [
-            "ID", "Name", "Description", "Temperature", "TopP", 
-            "MaxTokens", "FrequencyPenalty", "PresencePenalty", 
-            "CreatedAt", "LastUsed"
-        ]
-        
-        return dict(zip(Columns, Results[0]))
+        return dict(Preset)
     
     def UpdatePresetUsage(self, PresetName: str) -> bool:
         """
@@ -621,10 +1186,12 @@ class DBManager:
             True if updated, False if not found
         """
         Result = self.ExecuteNonQuery(
-            "UPDATE Presets SET LastUsed = CURRENT_TIMESTAMP WHERE Name = ?",
+            "UPDATE Presets SET LastUsed = CAST(strftime('%s', 'now') AS INTEGER) WHERE Name = ?",
             (PresetName,)
         )
         
+        self._DropTableCache("Presets")
+        
         return Result > 0
     
     # User-defined Preset Methods
@@ -636,15 +1203,24 @@ class DBManager:
         Returns:
             List of user preset dictionaries
         """
-        Results = self.ExecuteQuery("SELECT * FROM UserPresets ORDER BY Name")
+        return [dict(Preset) for Preset in self._GetPresetsCache("UserPresets").values()]
+    
+    def GetUserPreset(self, PresetName: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a specific user-defined preset.
         
-        Columns = [
-            "ID", "Name", "Description", "Temperature", "TopP", 
-            "MaxTokens", "FrequencyPenalty", "PresencePenalty", 
-            "CreatedAt", "LastUsed"
-        ]
+        Args:
+            PresetName: Name of the preset
+            
+        Returns:
+            User preset dictionary or None if not found
+        """
+        Preset = self._GetPresetsCache("UserPresets").get(PresetName)
         
-        return [dict(zip(Columns, Row)) for Row in Results]
+        if Preset is None:
+            return None
+        
+        return dict(Preset)
     
     def SaveUserPreset(self, PresetName: str, Description: str, Params: Dict[str, Any]) -> int:
         """
@@ -658,47 +1234,23 @@ class DBManager:
         Returns:
             Row ID of the saved preset
         """
-        # Check if preset exists
-        ExistingPreset = self.ExecuteQuery(
-            "SELECT ID FROM UserPresets WHERE Name = ?",
-            (PresetName,)
-        )
-        
-        if ExistingPreset:
-            # Update existing preset
-            Query = """
-            UPDATE UserPresets
-            SET Description = ?, Temperature = ?, TopP = ?, MaxTokens = ?, 
-                FrequencyPenalty = ?, PresencePenalty = ?,
-                LastUsed = CURRENT_TIMESTAMP
-            WHERE Name = ?
-            """
-            
-            self.ExecuteNonQuery(
-                Query,
-                (
-                    Description,
-                    Params.get('Temperature', 0.7),
-                    Params.get('TopP', 0.9),
-                    Params.get('MaxTokens', 2048),
-                    Params.get('FrequencyPenalty', 0.0),
-                    Params.get('PresencePenalty', 0.0),
-                    PresetName
-                )
-            )
-            
-            return ExistingPreset[0][0]
-        else:
-            # Insert new preset
-            Query = """
-            INSERT INTO UserPresets
-            (Name, Description, Temperature, TopP, MaxTokens, 
-             FrequencyPenalty, PresencePenalty)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            """
-            
-            return self.ExecuteNonQuery(
-                Query,
+        # Insert or update, returning the row ID either way
+        with self.Transaction() as Conn:
+            PresetID = self._UpsertReturningID(
+                Conn,
+                """
+                INSERT INTO UserPresets
+                (Name, Description, Temperature, TopP, MaxTokens, 
+                 FrequencyPenalty, PresencePenalty)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(Name) DO UPDATE
+                SET Description = excluded.Description,
+                    Temperature = excluded.Temperature, TopP = excluded.TopP,
+                    MaxTokens = excluded.MaxTokens,
+                    FrequencyPenalty = excluded.FrequencyPenalty,
+                    PresencePenalty = excluded.PresencePenalty,
+                    LastUsed = CAST(strftime('%s', 'now') AS INTEGER)
+                """,
                 (
                     PresetName,
                     Description,
@@ -707,8 +1259,14 @@ class DBManager:
                     Params.get('MaxTokens', 2048),
                     Params.get('FrequencyPenalty', 0.0),
                     Params.get('PresencePenalty', 0.0)
-                )
+                ),
+                "SELECT ID FROM UserPresets WHERE Name = ?",
+                (PresetName,)
             )
+        
+        self._DropTableCache("UserPresets")
+        
+        return PresetID
     
     def DeleteUserPreset(self, PresetName: str) -> bool:
         """
@@ -725,8 +1283,144 @@ class DBManager:
             (PresetName,)
         )
         
+        self._DropTableCache("UserPresets")
+        
         return Result > 0
     
+    # Typed Key/Value Methods
+    
+    def _EncodeValue(self, Value: Any) -> Tuple[Any, str]:
+        """
+        Encode a value for storage in a typed key/value table.
+        
+        Args:
+            Value: Value to encode
+            
+        Returns:
+            Tuple of (encoded value, value type)
+        """
+        Encoder = _ValueEncoders.get(type(Value))
+        
+        if Encoder is None:
+            # Subclasses (OrderedDict, IntEnum, ...) fall back to an isinstance check
+            Encoder = next(
+                (Entry for ValueType, Entry in _ValueEncoders.items() if isinstance(Value, ValueType)),
+                _StringEncoder
+            )
+        
+        Encode, ValueType = Encoder
+        return Encode(Value), ValueType
+    
+    def _GetTypedValue(self, Table: str, Key: str, Default: Any = None) -> Any:
+        """
+        Read and decode a value from a typed key/value table.
+        
+        Args:
+            Table: Table name (UserPreferences or AppSettings)
+            Key: Key to look up
+            Default: Default value if the key is not found
+            
+        Returns:
+            Decoded value
+        """
+        # Cache the stored form so JSON values are decoded into a fresh object per call
+        Entry = self._GetTableCache(Table, lambda: {
+            Key: (Value, ValueType)
+            for Key, Value, ValueType in self.ExecuteQuery(f"SELECT Key, Value, ValueType FROM {Table}")
+        }).get(Key)
+        
+        if Entry is None:
+            return Default
+        
+        return self._DecodeValue(*Entry)
+    
+    def _DecodeValue(self, Value: Any, ValueType: str) -> Any:
+        """
+        Decode a value stored in a typed key/value table.
+        
+        Args:
+            Value: Stored value
+            ValueType: Stored value type
+            
+        Returns:
+            Decoded value
+        """
+        Converter = _ValueConverters.get(ValueType)
+        
+        return Converter(Value) if Converter else Value
+    
+    def _SetTypedValues(self, Table: str, Items: Iterable[Tuple[str, Any]]) -> None:
+        """
+        Encode and upsert values in a typed key/value table with one batched statement.
+        
+        Existing rows keep their other columns (such as AppSettings descriptions).
+        
+        Args:
+            Table: Table name (UserPreferences or AppSettings)
+            Items: Iterable of (key, value) pairs
+        """
+        Rows = [(Key, *self._EncodeValue(Value)) for Key, Value in Items]
+        
+        with self.Transaction() as Conn:
+            Conn.executemany(
+                f"""
+                INSERT INTO {Table} (Key, Value, ValueType)
+                VALUES (?, ?, ?)
+                ON CONFLICT(Key) DO UPDATE
+                SET Value = excluded.Value, ValueType = excluded.ValueType,
+                    UpdatedAt = CAST(strftime('%s', 'now') AS INTEGER)
+                """,
+                Rows
+            )
+        
+        self._DropTableCache(Table)
+    
+    def _GetTableCache(self, Table: str, Load: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Get the cached rows of a table, loading them on first use.
+        
+        Rows read inside a transaction may still be rolled back, so they are
+        loaded without being cached, and a transaction that wrote to the table
+        always reloads it to see its own writes.
+        
+        Args:
+            Table: Table name
+            Load: Callable returning the table's rows as a dictionary
+            
+        Returns:
+            Dictionary of cached rows (must not be modified by callers)
+        """
+        if getattr(self._Local, 'InTransaction', False):
+            Cache = None if Table in self._Local.StaleTables else self._TableCaches.get(Table)
+            return Load() if Cache is None else Cache
+        
+        Cache = self._TableCaches.get(Table)
+        
+        if Cache is None:
+            with self._CacheLock:
+                Cache = self._TableCaches.get(Table)
+                
+                if Cache is None:
+                    Cache = self._TableCaches[Table] = Load()
+        
+        return Cache
+    
+    def _DropTableCache(self, Table: str) -> None:
+        """
+        Drop the cached rows of a table after writing to it.
+        
+        Inside a transaction the cache is dropped again when the outermost block
+        ends, so rows cached before the commit or rollback aren't kept.
+        
+        Args:
+            Table: Table that was written to
+        """
+        with self._CacheLock:
+            self._TableCaches.pop(Table, None)
+        
+        if getattr(self._Local, 'InTransaction', False):
+            self._Local.StaleTables.add(Table)
+    
     # User Preference Methods
     
     def GetUserPreference(self, Key: str, Default: Any = None) -> Any:
@@ -740,27 +1434,7 @@ class DBManager:
         Returns:
             Preference value
         """
-        Results = self.ExecuteQuery(
-            "SELECT Value, ValueType FROM UserPreferences WHERE Key = ?",
-            (Key,)
-        )
-        
-        if not Results:
-            return Default
-        
-        Value, ValueType = Results[0]
-        
-        # Convert value based on type
-        if ValueType == "int":
-            return int(Value)
-        elif ValueType == "float":
-            return float(Value)
-        elif ValueType == "bool":
-            return Value.lower() in ("true", "1", "yes")
-        elif ValueType == "json":
-            return json.loads(Value)
-        else:
-            return Value
+        return self._GetTypedValue("UserPreferences", Key, Default)
     
     def SetUserPreference(self, Key: str, Value: Any) -> None:
         """
@@ -770,48 +1444,16 @@ class DBManager:
             Key: Preference key
             Value: Preference value
         """
-        # Determine value type
-        if isinstance(Value, bool):
-            ValueStr = "true" if Value else "false"
-            ValueType = "bool"
-        elif isinstance(Value, int):
-            ValueStr = str(Value)
-            ValueType = "int"
-        elif isinstance(Value, float):
-            ValueStr = str(Value)
-            ValueType = "float"
-        elif isinstance(Value, (dict, list)):
-            ValueStr = json.dumps(Value)
-            ValueType = "json"
-        else:
-            ValueStr = str(Value)
-            ValueType = "string"
-        
-        # Check if preference exists
-        Results = self.ExecuteQuery(
-            "SELECT COUNT(*) FROM UserPreferences WHERE Key = ?",
-            (Key,)
-        )
+        self._SetTypedValues("UserPreferences", ((Key, Value),))
+    
+    def SetUserPreferencesBulk(self, Items: Iterable[Tuple[str, Any]]) -> None:
+        """
+        Set several user preferences with a single batched statement.
         
-        if Results[0][0] > 0:
-            # Update existing preference
-            self.ExecuteNonQuery(
-                """
-                UPDATE UserPreferences
-                SET Value = ?, ValueType = ?, UpdatedAt = CURRENT_TIMESTAMP
-                WHERE Key = ?
-                """,
-                (ValueStr, ValueType, Key)
-            )
-        else:
-            # Insert new preference
-            self.ExecuteNonQuery(
-                """
-                INSERT INTO UserPreferences (Key, Value, ValueType)
-                VALUES (?, ?, ?)
-                """,
-                (Key, ValueStr, ValueType)
-            )
+        Args:
+            Items: Iterable of (key, value) pairs
+        """
+        self._SetTypedValues("UserPreferences", Items)
     
     # App Settings Methods
     
@@ -821,94 +1463,112 @@ class DBManager:
         
         Args:
             Key: Setting key
-            Default: Default value if setting not found
+            Default: Default value if setting not found
+            
+        Returns:
+            Setting value
+        """
+        return self._GetTypedValue("AppSettings", Key, Default)
+    
+    def SetAppSetting(self, Key: str, Value: Any, Description: str = None) -> None:
+        """
+        Set an application setting.
+        
+        Args:
+            Key: Setting key
+            Value: Setting value
+            Description: Optional setting description
+        """
+        ValueStr, ValueType = self._EncodeValue(Value)
+        
+        # An empty description leaves an existing one untouched
+        self.ExecuteNonQuery(
+            """
+            INSERT INTO AppSettings (Key, Value, ValueType, Description)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(Key) DO UPDATE
+            SET Value = excluded.Value, ValueType = excluded.ValueType,
+                Description = COALESCE(NULLIF(excluded.Description, ''), Description),
+                UpdatedAt = CAST(strftime('%s', 'now') AS INTEGER)
+            """,
+            (Key, ValueStr, ValueType, Description)
+        )
+        
+        self._DropTableCache("AppSettings")
+    
+    def SetAppSettingsBulk(self, Items: Iterable[Tuple[str, Any]]) -> None:
+        """
+        Set several application settings with a single batched statement.
+        
+        Existing descriptions are preserved.
+        
+        Args:
+            Items: Iterable of (key, value) pairs
+        """
+        self._SetTypedValues("AppSettings", Items)
+    
+    def GetAppSettingPath(self, Key: str, JsonPath: str, Default: Any = None) -> Any:
+        """
+        Get one member of a JSON application setting without decoding the rest.
+        
+        Args:
+            Key: Setting key
+            JsonPath: SQLite JSON path within the setting (e.g. '$.Window.Width')
+            Default: Default value if the setting or path is not found
             
         Returns:
-            Setting value
+            Decoded value at the path
         """
+        # json_extract returns scalars as SQL values and containers as JSON text;
+        # json_type tells them apart and is NULL only when the path is missing
         Results = self.ExecuteQuery(
-            "SELECT Value, ValueType FROM AppSettings WHERE Key = ?",
-            (Key,)
+            """
+            SELECT json_type(Value, ?), json_extract(Value, ?)
+            FROM AppSettings WHERE Key = ? AND ValueType = 'json'
+            """,
+            (JsonPath, JsonPath, Key)
         )
         
-        if not Results:
+        if not Results or Results[0][0] is None:
             return Default
         
-        Value, ValueType = Results[0]
-        
-        # Convert value based on type
-        if ValueType == "int":
-            return int(Value)
-        elif ValueType == "float":
-            return float(Value)
-        elif ValueType == "bool":
-            return Value.lower() in ("true", "1", "yes")
-        elif ValueType == "json":
-            return json.loads(Value)
-        else:
-            return Value
+        MemberType, Member = Results[0]
+        
+        if MemberType in ('object', 'array'):
+            return _JsonLoads(Member)
+        
+        if MemberType in ('true', 'false'):
+            return bool(Member)
+        
+        return Member
     
-    def SetAppSetting(self, Key: str, Value: Any, Description: str = None) -> None:
+    def SetAppSettingPath(self, Key: str, JsonPath: str, Value: Any) -> bool:
         """
-        Set an application setting.
+        Set one member of a JSON application setting in place.
+        
+        SQLite edits the stored JSON directly, so the rest of the setting is not
+        round-tripped through Python.
         
         Args:
             Key: Setting key
-            Value: Setting value
-            Description: Optional setting description
+            JsonPath: SQLite JSON path within the setting (e.g. '$.Window.Width')
+            Value: New value for the member
+            
+        Returns:
+            True if updated, False if the setting doesn't exist or isn't JSON
         """
-        # Determine value type
-        if isinstance(Value, bool):
-            ValueStr = "true" if Value else "false"
-            ValueType = "bool"
-        elif isinstance(Value, int):
-            ValueStr = str(Value)
-            ValueType = "int"
-        elif isinstance(Value, float):
-            ValueStr = str(Value)
-            ValueType = "float"
-        elif isinstance(Value, (dict, list)):
-            ValueStr = json.dumps(Value)
-            ValueType = "json"
-        else:
-            ValueStr = str(Value)
-            ValueType = "string"
-        
-        # Check if setting exists
-        Results = self.ExecuteQuery(
-            "SELECT COUNT(*) FROM AppSettings WHERE Key = ?",
-            (Key,)
+        Result = self.ExecuteNonQuery(
+            """
+            UPDATE AppSettings
+            SET Value = json_set(Value, ?, json(?)), UpdatedAt = CAST(strftime('%s', 'now') AS INTEGER)
+            WHERE Key = ? AND ValueType = 'json'
+            """,
+            (JsonPath, _JsonDumps(Value), Key)
         )
         
-        if Results[0][0] > 0:
-            # Update existing setting
-            if Description:
-                self.ExecuteNonQuery(
-                    """
-                    UPDATE AppSettings
-                    SET Value = ?, ValueType = ?, Description = ?, UpdatedAt = CURRENT_TIMESTAMP
-                    WHERE Key = ?
-                    """,
-                    (ValueStr, ValueType, Description, Key)
-                )
-            else:
-                self.ExecuteNonQuery(
-                    """
-                    UPDATE AppSettings
-                    SET Value = ?, ValueType = ?, UpdatedAt = CURRENT_TIMESTAMP
-                    WHERE Key = ?
-                    """,
-                    (ValueStr, ValueType, Key)
-                )
-        else:
-            # Insert new setting
-            self.ExecuteNonQuery(
-                """
-                INSERT INTO AppSettings (Key, Value, ValueType, Description)
-                VALUES (?, ?, ?, ?)
-                """,
-                (Key, ValueStr, ValueType, Description)
-            )
+        self._DropTableCache("AppSettings")
+        
+        return Result > 0
     
     # UI String Methods
     
@@ -923,38 +1583,72 @@ class DBManager:
         Returns:
             UI string
         """
-        Results = self.ExecuteQuery(
-            "SELECT EnText FROM UIStrings WHERE Key = ?",
-            (Key,)
-        )
+        Text = self._GetUIStringsCache().get(Key)
         
-        if not Results:
+        if Text is None:
             return Default or Key
         
-        return Results[0][0]
+        return Text
+    
+    def _GetUIStringsCache(self) -> Dict[str, str]:
+        """
+        Get all UI strings keyed by key, loading them on first use.
+        
+        Returns:
+            Dictionary of UI strings (key -> text)
+        """
+        return self._GetTableCache("UIStrings", lambda: dict(self.ExecuteQuery("SELECT Key, EnText FROM UIStrings")))
     
-    def GetUIStrings(self, Context: str = None) -> Dict[str, str]:
+    def GetUIStrings(self, Context: str = None, Keys: Iterable[str] = None) -> Dict[str, str]:
         """
-        Get all UI strings, optionally filtered by context.
+        Get all UI strings, optionally filtered by context or limited to given keys.
         
         Args:
             Context: Optional context filter
+            Keys: Optional keys to fetch; unknown keys are left out of the result
             
         Returns:
             Dictionary of UI strings (key -> text)
         """
-        if Context:
-            Results = self.ExecuteQuery(
-                "SELECT Key, EnText FROM UIStrings WHERE Context = ?",
-                (Context,)
-            )
-        else:
-            Results = self.ExecuteQuery(
-                "SELECT Key, EnText FROM UIStrings"
-            )
+        if Keys is not None:
+            return self._GetUIStringsByKey(Context, Keys)
+        
+        if not Context:
+            return dict(self._GetUIStringsCache())
+        
+        Results = self.ExecuteQuery(
+            "SELECT Key, EnText FROM UIStrings WHERE Context = ?",
+            (Context,)
+        )
         
         return {Key: Text for Key, Text in Results}
     
+    def _GetUIStringsByKey(self, Context: Optional[str], Keys: Iterable[str]) -> Dict[str, str]:
+        """
+        Fetch only the requested UI strings, in batches that fit SQLite's parameter limit.
+        
+        Args:
+            Context: Optional context filter
+            Keys: Keys to fetch
+            
+        Returns:
+            Dictionary of UI strings (key -> text)
+        """
+        ContextParams = (Context,) if Context else ()
+        ContextClause = " AND Context = ?" if Context else ""
+        BatchSize = _MaxVariables - len(ContextParams)
+        
+        Strings = {}
+        KeyIter = iter(Keys)
+        
+        while Batch := tuple(islice(KeyIter, BatchSize)):
+            Strings.update(self.ExecuteQuery(
+                f"SELECT Key, EnText FROM UIStrings WHERE Key IN ({_Placeholders(len(Batch))}){ContextClause}",
+                Batch + ContextParams
+            ))
+        
+        return Strings
+    
     def SetUIString(self, Key: str, Text: str, Description: str = None, Context: str = None) -> None:
         """
         Set a UI string.
@@ -965,62 +1659,50 @@ class DBManager:
             Description: Optional description
             Context: Optional context
         """
-        # Check if string exists
-        Results = self.ExecuteQuery(
-            "SELECT COUNT(*) FROM UIStrings WHERE Key = ?",
-            (Key,)
+        # Empty descriptions and contexts leave existing ones untouched
+        self.ExecuteNonQuery(
+            """
+            INSERT INTO UIStrings (Key, EnText, Description, Context)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT(Key) DO UPDATE
+            SET EnText = excluded.EnText,
+                Description = COALESCE(NULLIF(excluded.Description, ''), Description),
+                Context = COALESCE(NULLIF(excluded.Context, ''), Context)
+            """,
+            (Key, Text, Description, Context)
         )
         
-        if Results[0][0] > 0:
-            # Update existing string
-            if Description and Context:
-                self.ExecuteNonQuery(
-                    """
-                    UPDATE UIStrings
-                    SET EnText = ?, Description = ?, Context = ?
-                    WHERE Key = ?
-                    """,
-                    (Text, Description, Context, Key)
-                )
-            elif Description:
-                self.ExecuteNonQuery(
-                    """
-                    UPDATE UIStrings
-                    SET EnText = ?, Description = ?
-                    WHERE Key = ?
-                    """,
-                    (Text, Description, Key)
-                )
-            elif Context:
-                self.ExecuteNonQuery(
-                    """
-                    UPDATE UIStrings
-                    SET EnText = ?, Context = ?
-                    WHERE Key = ?
-                    """,
-                    (Text, Context, Key)
-                )
-            else:
-                self.ExecuteNonQuery(
-                    """
-                    UPDATE UIStrings
-                    SET EnText = ?
-                    WHERE Key = ?
-                    """,
-                    (Text, Key)
-                )
+        # Once committed the cached text can be updated in place; inside a
+        # transaction it might still be rolled back, so reload it instead
+        if getattr(self._Local, 'InTransaction', False):
+            self._DropTableCache("UIStrings")
         else:
-            # Insert new string
-            self.ExecuteNonQuery(
-                """
-                INSERT INTO UIStrings (Key, EnText, Description, Context)
-                VALUES (?, ?, ?, ?)
-                """,
-                (Key, Text, Description, Context)
-            )
+            with self._CacheLock:
+                Cache = self._TableCaches.get("UIStrings")
+                
+                if Cache is not None:
+                    Cache[Key] = Text
     
     # Parameter Methods
     
+    def _GetParametersCache(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get parameter definitions keyed by name, loading them on first use.
+        
+        Returns:
+            Dictionary of parameter dictionaries in display order
+        """
+        return self._GetTableCache("Parameters", lambda: {
+            Row['Name']: dict(Row) for Row in self.ExecuteQueryIter(
+                """
+                SELECT Name, DisplayName, Description, MinValue, MaxValue, DefaultValue,
+                       StepSize, IsInteger, Category, OrderIndex
+                FROM Parameters
+                ORDER BY OrderIndex
+                """
+            )
+        })
+    
     def GetAllParameters(self) -> List[Dict[str, Any]]:
         """
         Get all parameter definitions.
@@ -1028,19 +1710,8 @@ class DBManager:
         Returns:
             List of parameter dictionaries
         """
-        Results = self.ExecuteQuery(
-            """
-            SELECT * FROM Parameters
-            ORDER BY OrderIndex
-            """
-        )
-        
-        Columns = [
-            "Name", "DisplayName", "Description", "MinValue", "MaxValue",
-            "DefaultValue", "StepSize", "IsInteger", "Category", "OrderIndex"
-        ]
-        
-        return [dict(zip(Columns, Row)) for Row in Results]
+        # Copies keep callers from modifying the cached definitions
+        return [dict(Parameter) for Parameter in self._GetParametersCache().values()]
     
     def GetParametersByCategory(self, Category: str) -> List[Dict[str, Any]]:
         """
@@ -1052,21 +1723,10 @@ class DBManager:
         Returns:
             List of parameter dictionaries
         """
-        Results = self.ExecuteQuery(
-            """
-            SELECT * FROM Parameters
-            WHERE Category = ?
-            ORDER BY OrderIndex
-            """,
-            (Category,)
-        )
-        
-        Columns = [
-            "Name", "DisplayName", "Description", "MinValue", "MaxValue",
-            "DefaultValue", "StepSize", "IsInteger", "Category", "OrderIndex"
+        return [
+            dict(Parameter) for Parameter in self._GetParametersCache().values()
+            if Parameter['Category'] == Category
         ]
-        
-        return [dict(zip(Columns, Row)) for Row in Results]
     
     def GetParameter(self, Name: str) -> Optional[Dict[str, Any]]:
         """
@@ -1078,26 +1738,80 @@ class DBManager:
         Returns:
             Parameter dictionary or None if not found
         """
-        Results = self.ExecuteQuery(
-            """
-            SELECT * FROM Parameters
-            WHERE Name = ?
-            """,
-            (Name,)
-        )
+        Parameter = self._GetParametersCache().get(Name)
         
-        if not Results:
+        if Parameter is None:
             return None
         
-        Columns = [
-            "Name", "DisplayName", "Description", "MinValue", "MaxValue",
-            "DefaultValue", "StepSize", "IsInteger", "Category", "OrderIndex"
+        return dict(Parameter)
+    
+    def SetParameters(self, Parameters: List[Dict[str, Any]]) -> None:
+        """
+        Insert or update parameter definitions in one transaction.
+        
+        Args:
+            Parameters: Parameter dictionaries; Name and DisplayName are required
+        """
+        Rows = [
+            (
+                Parameter['Name'], Parameter['DisplayName'], Parameter.get('Description'),
+                Parameter.get('MinValue'), Parameter.get('MaxValue'), Parameter.get('DefaultValue'),
+                Parameter.get('StepSize'), Parameter.get('IsInteger', False),
+                Parameter.get('Category'), Parameter.get('OrderIndex')
+            )
+            for Parameter in Parameters
         ]
         
-        return dict(zip(Columns, Results[0]))
+        with self.Transaction() as Conn:
+            Conn.executemany(
+                """
+                INSERT INTO Parameters (Name, DisplayName, Description, MinValue, MaxValue,
+                                        DefaultValue, StepSize, IsInteger, Category, OrderIndex)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(Name) DO UPDATE
+                SET DisplayName = excluded.DisplayName, Description = excluded.Description,
+                    MinValue = excluded.MinValue, MaxValue = excluded.MaxValue,
+                    DefaultValue = excluded.DefaultValue, StepSize = excluded.StepSize,
+                    IsInteger = excluded.IsInteger, Category = excluded.Category,
+                    OrderIndex = excluded.OrderIndex
+                """,
+                Rows
+            )
+        
+        self._DropTableCache("Parameters")
     
     # Generation History Methods
     
+    def _GenerationHistoryRow(self, ModelName: str, Prompt: str, Response: str,
+                              Params: Dict[str, Any], Metrics: Dict[str, Any]) -> tuple:
+        """
+        Build the bound values for a generation history insert.
+        
+        Args:
+            ModelName: Name of the model
+            Prompt: Input prompt
+            Response: Generated response
+            Params: Generation parameters
+            Metrics: Generation metrics
+            
+        Returns:
+            Tuple of values matching the history insert statement
+        """
+        return (
+            ModelName,
+            Prompt,
+            Response,
+            Params.get('Temperature', 0.7),
+            Params.get('TopP', 0.9),
+            Params.get('MaxTokens', 2048),
+            Params.get('FrequencyPenalty', 0.0),
+            Params.get('PresencePenalty', 0.0),
+            Metrics.get('InputTokens', 0),
+            Metrics.get('OutputTokens', 0),
+            Metrics.get('TotalTokens', 0),
+            Metrics.get('GenerationTime', 0.0)
+        )
+    
     def AddGenerationHistory(self, ModelName: str, Prompt: str, Response: str, 
                              Params: Dict[str, Any], Metrics: Dict[str, Any]) -> int:
         """
@@ -1113,36 +1827,117 @@ class DBManager:
         Returns:
             ID of the new history entry
         """
-        Query = """
-        INSERT INTO GenerationHistory (
-            ModelName, Prompt, Response, Temperature, TopP, MaxTokens,
-            FrequencyPenalty, PresencePenalty, InputTokens, OutputTokens,
-            TotalTokens, GenerationTime)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        return self.ExecuteNonQuery(
+            _InsertGenerationHistorySQL,
+            self._GenerationHistoryRow(ModelName, Prompt, Response, Params, Metrics)
+        )
+    
+    def BulkAddGenerationHistory(self, Entries: Iterable[Tuple[str, str, str, Dict[str, Any], Dict[str, Any]]]) -> None:
         """
+        Add several generation history entries with a single batched statement.
         
-        return self.ExecuteNonQuery(
-            Query,
-            (
-                ModelName,
-                Prompt,
-                Response,
-                Params.get('Temperature', 0.7),
-                Params.get('TopP', 0.9),
-                Params.get('MaxTokens', 2048),
-                Params.get('FrequencyPenalty', 0.0),
-                Params.get('PresencePenalty', 0.0),
-                Metrics.get('InputTokens', 0),
-                Metrics.get('OutputTokens', 0),
-                Metrics.get('TotalTokens', 0),
-                Metrics.get('GenerationTime', 0.0)
+        All rows share one prepared statement and one commit, so callers that
+        record history from a UI queue should collect entries and flush them
+        here periodically rather than calling AddGenerationHistory per entry.
+        
+        Args:
+            Entries: Iterable of (model name, prompt, response, parameters, metrics) tuples
+        """
+        Rows = [self._GenerationHistoryRow(*Entry) for Entry in Entries]
+        
+        with self.Transaction() as Conn:
+            Conn.executemany(_InsertGenerationHistorySQL, Rows)
+    
+    def EnqueueGenerationHistory(self, ModelName: str, Prompt: str, Response: str,
+                                Params: Dict[str, Any], Metrics: Dict[str, Any]) -> None:
+        """
+        Queue a generation history entry to be written by a background thread.
+        
+        Returns immediately; queued entries are committed together in batches.
+        Use FlushGenerationHistory to wait until they are stored.
+        
+        Args:
+            ModelName: Name of the model
+            Prompt: Input prompt
+            Response: Generated response
+            Params: Generation parameters
+            Metrics: Generation metrics
+        """
+        self._HistoryQueue.put(self._GenerationHistoryRow(ModelName, Prompt, Response, Params, Metrics))
+        
+        if self._HistoryWriter is None:
+            self._StartHistoryWriter()
+    
+    def FlushGenerationHistory(self) -> None:
+        """Wait until all queued generation history entries have been written."""
+        if self._HistoryWriter is not None:
+            self._HistoryQueue.join()
+    
+    def _StartHistoryWriter(self) -> None:
+        """Start the background generation history writer if it isn't running."""
+        with self._HistoryWriterLock:
+            if self._HistoryWriter is not None:
+                return
+            
+            self._HistoryWriter = threading.Thread(
+                target=self._RunHistoryWriter, name='GenerationHistoryWriter', daemon=True
             )
-        )
+            self._HistoryWriter.start()
+            
+            # Daemon threads are killed at exit, so write out what's still queued
+            atexit.register(self._StopHistoryWriter)
+    
+    def _StopHistoryWriter(self) -> None:
+        """Write out queued generation history and stop the background writer."""
+        with self._HistoryWriterLock:
+            Writer, self._HistoryWriter = self._HistoryWriter, None
+        
+        if Writer is None:
+            return
+        
+        atexit.unregister(self._StopHistoryWriter)
+        self._HistoryQueue.put(None)
+        Writer.join()
+    
+    def _RunHistoryWriter(self) -> None:
+        """Drain the generation history queue in batches until stopped."""
+        Stopping = False
+        
+        while not Stopping:
+            Rows = []
+            Row = self._HistoryQueue.get()
+            
+            # Gather whatever else arrives shortly after, up to one batch
+            Deadline = time.monotonic() + self._HistoryBatchWait
+            while Row is not None:
+                Rows.append(Row)
+                if len(Rows) >= self._HistoryBatchSize:
+                    break
+                
+                try:
+                    Row = self._HistoryQueue.get(timeout=max(Deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+            
+            Stopping = Row is None
+            
+            try:
+                if Rows:
+                    with self.Transaction() as Conn:
+                        Conn.executemany(_InsertGenerationHistorySQL, Rows)
+            except sqlite3.Error as Error:
+                self.Logger.error(f"Error writing {len(Rows)} queued generation history entries: {Error}")
+            finally:
+                for _ in range(len(Rows) + Stopping):
+                    self._HistoryQueue.task_done()
     
     def GetGenerationHistory(self, Limit: int = 100, Offset: int = 0) -> List[Dict[str, Any]]:
         """
         Get generation history entries.
         
+        SQLite still steps over every skipped row, so deep pages get slower;
+        use GetGenerationHistoryPage to page through long histories.
+        
         Args:
             Limit: Maximum number of entries to retrieve
             Offset: Offset for pagination
@@ -1150,28 +1945,17 @@ class DBManager:
         Returns:
             List of history entry dictionaries
         """
-        Results = self.ExecuteQuery(
-            """
-            SELECT * FROM GenerationHistory
-            ORDER BY CreatedAt DESC
-            LIMIT ? OFFSET ?
-            """,
-            (Limit, Offset)
-        )
-        
-        Columns = [
-            "ID", "ModelName", "Prompt", "Response", "Temperature",
-            "TopP", "MaxTokens", "FrequencyPenalty", "PresencePenalty",
-            "InputTokens", "OutputTokens", "TotalTokens",
-            "GenerationTime", "CreatedAt"
-        ]
+        Results = self.ExecuteQueryIter(_GenerationHistorySQL, (Limit, Offset))
         
-        return [dict(zip(Columns, Row)) for Row in Results]
+        return [dict(Row) for Row in Results]
     
     def GetGenerationHistoryForModel(self, ModelName: str, Limit: int = 100, Offset: int = 0) -> List[Dict[str, Any]]:
         """
         Get generation history entries for a specific model.
         
+        Deep pages get slower with the offset; use GetGenerationHistoryPage
+        to page through long histories.
+        
         Args:
             ModelName: Name of the model
             Limit: Maximum number of entries to retrieve
@@ -1180,34 +1964,101 @@ class DBManager:
         Returns:
             List of history entry dictionaries
         """
-        Results = self.ExecuteQuery(
-            """
-            SELECT * FROM GenerationHistory
-            WHERE ModelName = ?
-            ORDER BY CreatedAt DESC
-            LIMIT ? OFFSET ?
-            """,
-            (ModelName, Limit, Offset)
+        Results = self.ExecuteQueryIter(_GenerationHistoryForModelSQL, (ModelName, Limit, Offset))
+        
+        return [dict(Row) for Row in Results]
+    
+    def GetGenerationHistoryPage(self, BeforeID: Optional[int] = None, Limit: int = 100,
+                                 ModelName: Optional[str] = None,
+                                 IncludeText: bool = True) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+        """
+        Get one page of generation history, newest first, using keyset pagination.
+        
+        Pages continue from the entry whose ID is passed as BeforeID, so each page
+        is an index range scan no matter how deep into the history it is.
+        
+        Args:
+            BeforeID: ID returned with the previous page, or None for the first page
+            Limit: Maximum number of entries to retrieve
+            ModelName: Optional model name to filter by
+            IncludeText: Whether to include the Prompt and Response columns; list
+                views can leave them out and load one entry with GetGenerationHistoryEntry
+            
+        Returns:
+            Tuple of (history entry dictionaries, BeforeID for the next page or
+            None if this was the last page)
+        """
+        Params = [Value for Value in (ModelName, BeforeID) if Value is not None]
+        
+        Results = self.ExecuteQueryIter(
+            _GenerationHistoryPageSQL[ModelName is not None, BeforeID is not None, IncludeText],
+            (*Params, Limit)
         )
         
-        Columns = [
-            "ID", "ModelName", "Prompt", "Response", "Temperature",
-            "TopP", "MaxTokens", "FrequencyPenalty", "PresencePenalty",
-            "InputTokens", "OutputTokens", "TotalTokens",
-            "GenerationTime", "CreatedAt"
-        ]
+        Entries = [dict(Row) for Row in Results]
+        NextBeforeID = Entries[-1]['ID'] if len(Entries) == Limit else None
+        
+        return Entries, NextBeforeID
+    
+    def GetGenerationHistoryEntry(self, EntryID: int) -> Optional[Dict[str, Any]]:
+        """
+        Get a single generation history entry, including its prompt and response.
+        
+        Args:
+            EntryID: ID of the history entry
+            
+        Returns:
+            History entry dictionary or None if not found
+        """
+        Results = self.ExecuteQuery(_SelectGenerationHistorySQL + "WHERE ID = ?", (EntryID,))
+        
+        if not Results:
+            return None
         
-        return [dict(zip(Columns, Row)) for Row in Results]
+        return dict(Results[0])
     
     def ClearGenerationHistory(self) -> int:
         """
         Clear all generation history.
         
+        GenerationHistory has no triggers and no child tables, so SQLite's truncate
+        optimization applies and the table is emptied without visiting each row.
+        
         Returns:
             Number of entries deleted
         """
         return self.ExecuteNonQuery("DELETE FROM GenerationHistory")
     
+    def ResetGenerationHistory(self) -> None:
+        """
+        Drop and recreate the generation history table.
+        
+        Unlike ClearGenerationHistory, this also restarts entry IDs and hands
+        the freed pages back to the file system.
+        """
+        with self.Transaction() as Conn:
+            # Recreate the table and its indexes exactly as currently defined
+            Statements = [
+                Row[0] for Row in Conn.execute(
+                    """
+                    SELECT sql FROM sqlite_master
+                    WHERE tbl_name = 'GenerationHistory' AND sql IS NOT NULL
+                    ORDER BY type = 'index'
+                    """
+                )
+            ]
+            
+            Conn.execute("DROP TABLE GenerationHistory")
+            
+            for Statement in Statements:
+                Conn.execute(Statement)
+        
+        # The sqlite3 module steps a statement without result columns only once,
+        # which frees a single page; executescript runs the pragma to completion.
+        # Inside an outer transaction the drop isn't committed yet, so skip it.
+        if not getattr(self._Local, 'InTransaction', False):
+            self.GetConnection().executescript("PRAGMA incremental_vacuum")
+    
     # Benchmark Methods
     
     def AddBenchmarkResult(self, BenchmarkName: str, ModelName: str, Prompt: str,
@@ -1229,29 +2080,29 @@ class DBManager:
         Returns:
             ID of the new benchmark result
         """
-        # Save model configuration
-        ConfigID = self.SaveModelConfig(ModelName, f"Benchmark-{BenchmarkName}", ConfigParams)
-        
-        Query = """
-        INSERT INTO BenchmarkResults (
-            BenchmarkName, ModelName, ConfigID, Prompt,
-            AverageTime, AverageTokens, AverageTokensPerSecond, Runs)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        
-        return self.ExecuteNonQuery(
-            Query,
-            (
-                BenchmarkName,
-                ModelName,
-                ConfigID,
-                Prompt,
-                AverageTime,
-                AverageTokens,
-                TokensPerSecond,
-                Runs
-            )
-        )
+        # Save the configuration and the result together: one commit, and no
+        # configuration is left behind if the result insert fails
+        with self.Transaction() as Conn:
+            ConfigID = self.SaveModelConfig(ModelName, f"Benchmark-{BenchmarkName}", ConfigParams)
+            
+            return Conn.execute(
+                """
+                INSERT INTO BenchmarkResults (
+                    BenchmarkName, ModelName, ConfigID, Prompt,
+                    AverageTime, AverageTokens, AverageTokensPerSecond, Runs)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    BenchmarkName,
+                    ModelName,
+                    ConfigID,
+                    Prompt,
+                    AverageTime,
+                    AverageTokens,
+                    TokensPerSecond,
+                    Runs
+                )
+            ).lastrowid
     
     def GetBenchmarkResults(self, ModelName: str = None) -> List[Dict[str, Any]]:
         """
@@ -1264,36 +2115,11 @@ class DBManager:
             List of benchmark result dictionaries
         """
         if ModelName:
-            Results = self.ExecuteQuery(
-                """
-                SELECT b.*, c.Temperature, c.TopP, c.MaxTokens, 
-                       c.FrequencyPenalty, c.PresencePenalty
-                FROM BenchmarkResults b
-                JOIN ModelConfigs c ON b.ConfigID = c.ID
-                WHERE b.ModelName = ?
-                ORDER BY b.CreatedAt DESC
-                """,
-                (ModelName,)
-            )
+            Results = self.ExecuteQueryIter(_BenchmarkResultsForModelSQL, (ModelName,))
         else:
-            Results = self.ExecuteQuery(
-                """
-                SELECT b.*, c.Temperature, c.TopP, c.MaxTokens, 
-                       c.FrequencyPenalty, c.PresencePenalty
-                FROM BenchmarkResults b
-                JOIN ModelConfigs c ON b.ConfigID = c.ID
-                ORDER BY b.CreatedAt DESC
-                """
-            )
-        
-        Columns = [
-            "ID", "BenchmarkName", "ModelName", "ConfigID", "Prompt",
-            "AverageTime", "AverageTokens", "AverageTokensPerSecond", "Runs",
-            "CreatedAt", "Temperature", "TopP", "MaxTokens",
-            "FrequencyPenalty", "PresencePenalty"
-        ]
+            Results = self.ExecuteQueryIter(_BenchmarkResultsSQL)
         
-        return [dict(zip(Columns, Row)) for Row in Results]
+        return [dict(Row) for Row in Results]
     
     # Database Utility Methods
     
@@ -1301,35 +2127,67 @@ class DBManager:
         """
         Create a backup of the database.
         
+        Inside a Transaction() the backup holds the last committed state; the
+        transaction's own pending changes are not included.
+        
         Args:
             BackupPath: Path for the backup file
             
         Returns:
             True if successful, False otherwise
         """
+        SeparateConn = None
         try:
             # Ensure directory exists
             os.makedirs(os.path.dirname(BackupPath), exist_ok=True)
             
-            # Connect to source database
-            SourceConn = sqlite3.connect(self.DBPath)
-            
-            # Connect to backup database
-            BackupConn = sqlite3.connect(BackupPath)
+            if getattr(self._Local, 'InTransaction', False):
+                # VACUUM INTO cannot run inside an open transaction, so read the
+                # committed snapshot through a short-lived connection instead
+                SeparateConn = sqlite3.connect(self.DBPath)
+                SourceConn = SeparateConn
+            else:
+                # Copy from the pooled connection, whose page cache is already warm
+                SourceConn = self.GetConnection()
+                
+                # Refresh planner statistics so the backup carries them too
+                SourceConn.execute("PRAGMA optimize")
             
-            # Copy database content
-            SourceConn.backup(BackupConn)
+            # VACUUM INTO writes a compacted copy from one read snapshot, which in
+            # WAL mode doesn't block writers. It refuses to overwrite a non-empty
+            # file, so write beside the target and swap it in once complete.
+            TempPath = BackupPath + ".tmp"
+            if os.path.exists(TempPath):
+                os.remove(TempPath)
             
-            # Close connections
-            SourceConn.close()
-            BackupConn.close()
+            SourceConn.execute("VACUUM INTO ?", (TempPath,))
+            os.replace(TempPath, BackupPath)
             
             self.Logger.info(f"Database backed up to: {BackupPath}")
             return True
         
-        except sqlite3.Error as Error:
+        except (sqlite3.Error, OSError) as Error:
             self.Logger.error(f"Error backing up database: {Error}")
             return False
+        
+        finally:
+            if SeparateConn is not None:
+                SeparateConn.close()
+    
+    def BackupDatabaseAsync(self, BackupPath: str) -> Future:
+        """
+        Create a backup of the database on a background thread.
+        
+        The copy runs through BackupDatabase on its own pooled connection, so
+        the calling thread (typically the UI event loop) is not blocked.
+        
+        Args:
+            BackupPath: Path for the backup file
+            
+        Returns:
+            Future resolving to True if successful, False otherwise
+        """
+        return self._SubmitBackground(self.BackupDatabase, BackupPath)
     
     def RestoreDatabase(self, BackupPath: str) -> bool:
         """
@@ -1346,24 +2204,22 @@ class DBManager:
                 self.Logger.error(f"Backup file not found: {BackupPath}")
                 return False
             
-            # Close any open connections
-            try:
-                self.GetConnection().close()
-            except:
-                pass
-            
             # Connect to backup database
             BackupConn = sqlite3.connect(BackupPath)
             
-            # Connect to target database
-            TargetConn = sqlite3.connect(self.DBPath)
+            # Copy database content into the pooled connection; other pooled
+            # connections see the restored pages on their next read
+            try:
+                BackupConn.backup(self.GetConnection())
+            finally:
+                BackupConn.close()
             
-            # Copy database content
-            BackupConn.backup(TargetConn)
+            # Backups made by older versions get the same upgrades as at startup
+            self._MigrateSchema(self.GetConnection().cursor())
             
-            # Close connections
-            BackupConn.close()
-            TargetConn.close()
+            # Drop cached table contents
+            with self._CacheLock:
+                self._TableCaches.clear()
             
             self.Logger.info(f"Database restored from: {BackupPath}")
             return True
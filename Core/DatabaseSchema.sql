@@ -2,13 +2,13 @@
 -- Path: OllamaModelEditor/Core/DatabaseSchema.sql
 -- Standard: AIDEV-PascalCase-1.2
 -- Created: 2025-03-12
--- Last Modified: 2025-03-12 08:45PM
+-- Last Modified: 2026-10-15
 -- Description: SQL schema for the OllamaModelEditor database
 
 -- Database version
 CREATE TABLE IF NOT EXISTS DBVersion (
     Version INTEGER PRIMARY KEY,
-    AppliedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    AppliedAt INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
 );
 
 -- Model configurations
@@ -21,8 +21,8 @@ CREATE TABLE IF NOT EXISTS ModelConfigs (
     MaxTokens INTEGER DEFAULT 2048,
     FrequencyPenalty REAL DEFAULT 0.0,
     PresencePenalty REAL DEFAULT 0.0,
-    CreatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    LastUsed TIMESTAMP,
+    CreatedAt INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+    LastUsed INTEGER,
     IsDefault BOOLEAN DEFAULT 0,
     UNIQUE(ModelName, ConfigName)
 );
@@ -37,8 +37,8 @@ CREATE TABLE IF NOT EXISTS Presets (
     MaxTokens INTEGER DEFAULT 2048,
     FrequencyPenalty REAL DEFAULT 0.0,
     PresencePenalty REAL DEFAULT 0.0,
-    CreatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    LastUsed TIMESTAMP
+    CreatedAt INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+    LastUsed INTEGER
 );
 
 -- User-defined presets
@@ -51,25 +51,25 @@ CREATE TABLE IF NOT EXISTS UserPresets (
     MaxTokens INTEGER DEFAULT 2048,
     FrequencyPenalty REAL DEFAULT 0.0,
     PresencePenalty REAL DEFAULT 0.0,
-    CreatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-    LastUsed TIMESTAMP
+    CreatedAt INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
+    LastUsed INTEGER
 );
 
 -- User preferences
 CREATE TABLE IF NOT EXISTS UserPreferences (
     Key TEXT PRIMARY KEY,
-    Value TEXT,
+    Value,  -- Stored natively: INTEGER for int/bool, REAL for float, TEXT otherwise
     ValueType TEXT,  -- For type conversion: "string", "int", "float", "bool", "json"
-    UpdatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    UpdatedAt INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
 );
 
 -- Application settings
 CREATE TABLE IF NOT EXISTS AppSettings (
     Key TEXT PRIMARY KEY,
-    Value TEXT,
+    Value,  -- Stored natively, as in UserPreferences
     ValueType TEXT,  -- For type conversion
     Description TEXT,
-    UpdatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    UpdatedAt INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
 );
 
 -- Parameter definitions and descriptions
@@ -101,7 +101,7 @@ CREATE TABLE IF NOT EXISTS GenerationHistory (
     OutputTokens INTEGER,
     TotalTokens INTEGER,
     GenerationTime REAL,  -- in seconds
-    CreatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    CreatedAt INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
 );
 
 -- Benchmark results
@@ -115,7 +115,7 @@ CREATE TABLE IF NOT EXISTS BenchmarkResults (
     AverageTokens INTEGER,
     AverageTokensPerSecond REAL,
     Runs INTEGER,  -- Number of benchmark runs
-    CreatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CreatedAt INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER)),
     FOREIGN KEY(ConfigID) REFERENCES ModelConfigs(ID)
 );
 
@@ -124,7 +124,7 @@ CREATE TABLE IF NOT EXISTS UIMessages (
     Key TEXT PRIMARY KEY,
     Message TEXT NOT NULL,
     Context TEXT,  -- e.g., "error", "info", "tooltip"
-    UpdatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    UpdatedAt INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
 );
 
 -- UI strings for internationalization
@@ -134,3 +134,12 @@ CREATE TABLE IF NOT EXISTS UIStrings (
     Description TEXT,
     Context TEXT   -- Where this string is used
 );
+
+-- Indexes for history and benchmark lookups (ModelConfigs lookups by
+-- ModelName are already served by its UNIQUE(ModelName, ConfigName) index)
+CREATE INDEX IF NOT EXISTS IX_GenerationHistory_CreatedAt ON GenerationHistory(CreatedAt);
+CREATE INDEX IF NOT EXISTS IX_GenerationHistory_ModelName ON GenerationHistory(ModelName, CreatedAt);
+CREATE INDEX IF NOT EXISTS IX_BenchmarkResults_ModelName ON BenchmarkResults(ModelName, CreatedAt);
+
+-- Benchmark lookups by configuration (and foreign key checks when a configuration is deleted)
+CREATE INDEX IF NOT EXISTS IX_BenchmarkResults_ConfigID ON BenchmarkResults(ConfigID);
@@ -2,11 +2,14 @@
 # Path: OllamaModelEditor/Core/LoggingUtils.py
 # Standard: AIDEV-PascalCase-1.2
 # Created: 2025-03-11
-# Last Modified: 2025-03-11
+# Last Modified: 2026-10-15
 # Description: Logging utilities for the OllamaModelEditor application
 
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 from pathlib import Path
 
 def SetupLogging(LogLevel=logging.INFO, LogToFile=True):
@@ -17,6 +20,12 @@ def SetupLogging(LogLevel=logging.INFO, LogToFile=True):
         LogLevel: Logging level (default: INFO)
         LogToFile: Whether to log to file (default: True)
     """
+    # The log format never shows thread or process details, so skip collecting
+    # them for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    
     # Create logger
     Logger = logging.getLogger('OllamaModelEditor')
     Logger.setLevel(LogLevel)
@@ -28,7 +37,7 @@ def SetupLogging(LogLevel=logging.INFO, LogToFile=True):
     ConsoleHandler = logging.StreamHandler()
     ConsoleHandler.setLevel(LogLevel)
     ConsoleHandler.setFormatter(Formatter)
-    Logger.addHandler(ConsoleHandler)
+    Handlers = [ConsoleHandler]
     
     # Create file handler if requested
     if LogToFile:
@@ -42,11 +51,21 @@ def SetupLogging(LogLevel=logging.INFO, LogToFile=True):
         # Create directory if it doesn't exist
         LogDir.mkdir(parents=True, exist_ok=True)
         
-        # Create file handler
+        # Create a rotating file handler; the file is only opened on the first write
         LogFile = LogDir / 'ollamaModelEditor.log'
-        FileHandler = logging.FileHandler(str(LogFile))
+        FileHandler = logging.handlers.RotatingFileHandler(
+            str(LogFile), maxBytes=10 * 1024 * 1024, backupCount=5, delay=True
+        )
         FileHandler.setLevel(LogLevel)
         FileHandler.setFormatter(Formatter)
-        Logger.addHandler(FileHandler)
+        Handlers.append(FileHandler)
+    
+    # Log calls only queue the record; a background listener does the console
+    # and file writes. Stopping the listener at exit drains the queue first.
+    LogQueue = queue.Queue(-1)
+    Logger.addHandler(logging.handlers.QueueHandler(LogQueue))
+    Listener = logging.handlers.QueueListener(LogQueue, *Handlers, respect_handler_level=True)
+    Listener.start()
+    atexit.register(Listener.stop)
     
     return Logger
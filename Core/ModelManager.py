@@ -138,7 +138,7 @@ class ModelManager:
                 self.DB.ExecuteNonQuery(
                     """
                     UPDATE ModelConfigs 
-                    SET LastUsed = CURRENT_TIMESTAMP 
+                    SET LastUsed = CAST(strftime('%s', 'now') AS INTEGER) 
                     WHERE ModelName = ?
                     """,
                     (ModelName,)
@@ -88,17 +88,14 @@ class ModelManagerExtensions:
                 }
             
             # Try to get from user presets
-            UserPreset = self.DB.ExecuteQuery(
-                "SELECT * FROM UserPresets WHERE Name = ?",
-                (PresetName,)
-            )
+            UserPreset = self.DB.GetUserPreset(PresetName)
             if UserPreset:
                 return {
-                    'Temperature': UserPreset[0][3],  # Index based on UserPresets schema
-                    'TopP': UserPreset[0][4],
-                    'MaxTokens': UserPreset[0][5],
-                    'FrequencyPenalty': UserPreset[0][6],
-                    'PresencePenalty': UserPreset[0][7]
+                    'Temperature': UserPreset['Temperature'],
+                    'TopP': UserPreset['TopP'],
+                    'MaxTokens': UserPreset['MaxTokens'],
+                    'FrequencyPenalty': UserPreset['FrequencyPenalty'],
+                    'PresencePenalty': UserPreset['PresencePenalty']
                 }
         
         # Return default parameters if preset not found
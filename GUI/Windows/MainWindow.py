@@ -602,11 +602,12 @@ class MainWindow(QMainWindow):
         
         Save user preferences before closing.
         """
-        # Save window state and geometry
-        self.Config.SetUserPreference('WindowState', self.saveState())
-        self.Config.SetUserPreference('WindowGeometry', self.saveGeometry())
-        self.Config.SetUserPreference('WindowWidth', self.width())
-        self.Config.SetUserPreference('WindowHeight', self.height())
+        # Save window state and geometry in one commit
+        with self.Config.BatchUpdates():
+            self.Config.SetUserPreference('WindowState', self.saveState())
+            self.Config.SetUserPreference('WindowGeometry', self.saveGeometry())
+            self.Config.SetUserPreference('WindowWidth', self.width())
+            self.Config.SetUserPreference('WindowHeight', self.height())
         
         # Save configuration
         self.Config.SaveConfig()
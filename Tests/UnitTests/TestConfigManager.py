@@ -13,13 +13,16 @@ import tempfile
 import unittest
 from pathlib import Path
 from typing import Dict, Any
+from unittest import mock
 
 # Add project root to path for imports
 ProjectRoot = Path(__file__).resolve().parents[2]
 sys.path.append(str(ProjectRoot))
 
 # Import the module to test
-from Core.ConfigManager import ConfigManager
+from Core import ConfigManager as ConfigManagerModule
+from Core.ConfigManager import ConfigManager, zstandard
+from Core.DBManager import DBManager
 
 class TestConfigManager(unittest.TestCase):
     """Test case for the ConfigManager class."""
@@ -117,6 +120,112 @@ class TestConfigManager(unittest.TestCase):
         self.assertEqual(NewConfigManager.ModelConfigs, TestModelConfigs)
         self.assertEqual(NewConfigManager.UserPreferences, TestUserPreferences)
     
+    def test_SaveConfigPicksUpChanges(self):
+        """Test that changes made between saves are written out."""
+        # Save an initial configuration
+        self.ConfigManager.SetUserPreference('UIFontSize', 12)
+        self.ConfigManager.SetAppConfig('Theme', 'light')
+        self.assertTrue(self.ConfigManager.SaveConfig())
+        
+        # Change a single preference and save again
+        self.ConfigManager.SetUserPreference('UIFontSize', 16)
+        self.assertTrue(self.ConfigManager.SaveConfig())
+        
+        # Reload and check that both the changed and unchanged values persisted
+        NewConfigManager = ConfigManager(self.ConfigPath)
+        self.assertTrue(NewConfigManager.LoadConfig())
+        self.assertEqual(NewConfigManager.UserPreferences, {'UIFontSize': 16})
+        self.assertEqual(NewConfigManager.AppConfig, {'Theme': 'light'})
+    
+    def test_SaveConfigPicksUpInPlaceChanges(self):
+        """Test that sections changed in place between saves are written out."""
+        self.ConfigManager.SetAppConfig('Theme', 'light')
+        self.ConfigManager.SetModelConfig('ModelA', {'Temperature': 0.5})
+        self.ConfigManager.AddRecentModel('ModelA')
+        self.assertTrue(self.ConfigManager.SaveConfig())
+        
+        # Configs handed out by the getters may be modified directly
+        self.ConfigManager.GetModelConfig('ModelA')['Temperature'] = 0.9
+        AppConfig = self.ConfigManager.GetAppConfig()
+        del AppConfig['Theme']
+        AppConfig['Language'] = 'en'
+        self.ConfigManager.AddRecentModel('ModelB')
+        self.assertTrue(self.ConfigManager.SaveConfig())
+        
+        NewConfigManager = ConfigManager(self.ConfigPath)
+        self.assertTrue(NewConfigManager.LoadConfig())
+        self.assertEqual(NewConfigManager.ModelConfigs, {'ModelA': {'Temperature': 0.9}})
+        self.assertEqual(NewConfigManager.AppConfig, {'Language': 'en'})
+        self.assertEqual(NewConfigManager.UserPreferences, {'RecentModels': ['ModelB', 'ModelA']})
+    
+    @unittest.skipIf(zstandard is None, "zstandard is not installed")
+    def test_SaveAndLoadCompressedConfig(self):
+        """Test round trip of a zstd-compressed configuration file."""
+        CompressedPath = os.path.join(self.TempDir.name, "Config.json.zst")
+        Manager = ConfigManager(CompressedPath)
+        Manager.SetAppConfig('Theme', 'dark')
+        Manager.SetUserPreference('RecentModels', ['llama2', 'mistral'])
+        self.assertTrue(Manager.SaveConfig())
+        
+        NewConfigManager = ConfigManager(CompressedPath)
+        self.assertTrue(NewConfigManager.LoadConfig())
+        self.assertEqual(NewConfigManager.AppConfig, {'Theme': 'dark'})
+        self.assertEqual(NewConfigManager.UserPreferences, {'RecentModels': ['llama2', 'mistral']})
+    
+    def test_SerializeNestedConfig(self):
+        """Test (de)serialization of nested configuration dictionaries."""
+        NestedConfig = {
+            'Window': {
+                'Layout': {'Splitter': [200, 600]},
+                'Custom': {'__qt_type__': 'QUnknownType', 'repr': 'QUnknownType()'}
+            },
+            'Theme': 'dark'
+        }
+        
+        Serialized = self.ConfigManager._SerializeQtObjects(NestedConfig)
+        self.assertEqual(Serialized, NestedConfig)
+        
+        # Unknown Qt types keep their tagged dictionaries
+        Deserialized = self.ConfigManager._DeserializeQtObjects(Serialized)
+        self.assertEqual(Deserialized, NestedConfig)
+        self.assertIsNot(Deserialized['Window'], NestedConfig['Window'])
+    
+    def test_NestedQtObjectFlagsSection(self):
+        """Test that Qt objects nested inside containers mark their section for serialization."""
+        QtLike = type('QByteArray', (), {'__module__': 'PySide6.QtCore'})
+        
+        self.ConfigManager.SetUserPreference('Theme', {'Name': 'dark', 'Sizes': [1, 2]})
+        self.assertFalse(self.ConfigManager._HasQtObjects['UserPreferences'])
+        
+        self.ConfigManager.SetUserPreference('Layout', {'Docks': [{'State': QtLike()}]})
+        self.assertTrue(self.ConfigManager._HasQtObjects['UserPreferences'])
+    
+    def test_QtObjectsSurviveReload(self):
+        """Test that Qt objects restored from a file are serialized again on the next save."""
+        QByteArray = type('QByteArray', (bytes,), {'__module__': 'PySide6.QtCore'})
+        Serializers = {QByteArray: lambda Value: {'__qt_type__': 'QByteArray', 'data': bytes(Value).hex()}}
+        Deserializers = {'QByteArray': lambda Value: QByteArray(bytes.fromhex(Value['data']))}
+        ConfigPath = os.path.join(self.TempDir.name, "qt_config.json")
+        
+        with mock.patch.dict(ConfigManagerModule._QtSerializers, Serializers), \
+                mock.patch.dict(ConfigManagerModule._QtDeserializers, Deserializers):
+            Manager = ConfigManager(ConfigPath)
+            Manager.SetModelConfig('m', {'State': QByteArray(b'abc')})
+            self.assertTrue(Manager.SaveConfig())
+            
+            Reloaded = ConfigManager(ConfigPath)
+            self.assertTrue(Reloaded.LoadConfig())
+            self.assertIsInstance(Reloaded.ModelConfigs['m']['State'], QByteArray)
+            self.assertEqual(
+                Reloaded._HasQtObjects,
+                {'AppConfig': False, 'ModelConfigs': True, 'UserPreferences': False}
+            )
+            self.assertTrue(Reloaded.SaveConfig())
+            
+            Again = ConfigManager(ConfigPath)
+            self.assertTrue(Again.LoadConfig())
+            self.assertEqual(Again.ModelConfigs['m']['State'], b'abc')
+    
     def test_GetSetAppConfig(self):
         """Test get and set methods for AppConfig."""
         # Set test values
@@ -193,6 +302,80 @@ class TestConfigManager(unittest.TestCase):
         NonExistentValue = self.ConfigManager.GetUserPreference('NonExistentPref', 'DefaultValue')
         self.assertEqual(NonExistentValue, 'DefaultValue')
     
+    def test_DatabaseReadCache(self):
+        """Test that cached database reads see subsequent writes."""
+        DB = DBManager(os.path.join(self.TempDir.name, "test.db"))
+        DBConfigManager = ConfigManager(self.ConfigPath, DB)
+        
+        DBConfigManager.SetUserPreference('UIFontSize', 12)
+        self.assertEqual(DBConfigManager.GetUserPreference('UIFontSize'), 12)
+        
+        # Writes through the ConfigManager invalidate the cached value
+        DBConfigManager.SetUserPreference('UIFontSize', 16)
+        self.assertEqual(DBConfigManager.GetUserPreference('UIFontSize'), 16)
+        
+        # Misses are cached too, but still fall back to the default
+        self.assertEqual(DBConfigManager.GetAppConfig('Missing', 'Default'), 'Default')
+        DBConfigManager.SetAppConfig('Missing', 'Value')
+        self.assertEqual(DBConfigManager.GetAppConfig('Missing', 'Default'), 'Value')
+        
+        # Writes made directly through the database manager are seen as well
+        DB.SetUserPreference('UIFontSize', 18)
+        self.assertEqual(DBConfigManager.GetUserPreference('UIFontSize'), 18)
+        DBConfigManager.GetModelConfig('ModelA')
+        DB.SaveModelConfig('ModelA', 'Default', {'Temperature': 0.3})
+        self.assertEqual(DBConfigManager.GetModelConfig('ModelA')['Temperature'], 0.3)
+        
+        # Returned containers are copies, so callers can't corrupt later reads
+        DBConfigManager.SetUserPreference('RecentModels', ['Model1'])
+        DBConfigManager.GetUserPreference('RecentModels').append('Model2')
+        self.assertEqual(DBConfigManager.GetUserPreference('RecentModels'), ['Model1'])
+    
+    def test_BatchUpdates(self):
+        """Test committing several setter writes together."""
+        DB = DBManager(os.path.join(self.TempDir.name, "test.db"))
+        DBConfigManager = ConfigManager(self.ConfigPath, DB)
+        
+        with DBConfigManager.BatchUpdates():
+            DBConfigManager.SetUserPreference('WindowWidth', 800)
+            DBConfigManager.SetUserPreference('WindowHeight', 600)
+        
+        self.assertEqual(DB.GetUserPreference('WindowWidth'), 800)
+        self.assertEqual(DB.GetUserPreference('WindowHeight'), 600)
+        
+        # A failing batch leaves the database untouched
+        with self.assertRaises(RuntimeError):
+            with DBConfigManager.BatchUpdates():
+                DBConfigManager.SetUserPreference('WindowWidth', 1024)
+                raise RuntimeError("Batch aborted")
+        
+        self.assertEqual(DB.GetUserPreference('WindowWidth'), 800)
+        
+        # Without a database the setters only update memory
+        with self.ConfigManager.BatchUpdates():
+            self.ConfigManager.SetUserPreference('WindowWidth', 640)
+        
+        self.assertEqual(self.ConfigManager.GetUserPreference('WindowWidth'), 640)
+    
+    def test_LoadConfigFromDatabase(self):
+        """Test loading typed settings and preferences from the database."""
+        DB = DBManager(os.path.join(self.TempDir.name, "test.db"))
+        DB.SetAppSetting('MaxConcurrentRequests', 3)
+        DB.SetAppSetting('Theme', 'dark')
+        DB.SetUserPreference('ShowWelcomeOnStartup', False)
+        DB.SetUserPreference('SplitterRatio', 0.25)
+        DB.SetUserPreference('RecentModels', ['Model1', 'Model2'])
+        
+        DBConfigManager = ConfigManager(self.ConfigPath, DB)
+        self.assertTrue(DBConfigManager.LoadConfig())
+        
+        self.assertEqual(DBConfigManager.AppConfig, {'MaxConcurrentRequests': 3, 'Theme': 'dark'})
+        self.assertEqual(DBConfigManager.UserPreferences, {
+            'ShowWelcomeOnStartup': False,
+            'SplitterRatio': 0.25,
+            'RecentModels': ['Model1', 'Model2']
+        })
+    
     def test_AddRecentModel(self):
         """Test adding models to recent models list."""
         # Initially recent models should be empty
@@ -267,6 +450,28 @@ class TestConfigManager(unittest.TestCase):
         BadFormatResult = self.ConfigManager.ExportModelConfig('TestModel', BadFormatPath)
         self.assertFalse(BadFormatResult, "ExportModelConfig should return False for unsupported format")
     
+    def test_ImportModelConfig(self):
+        """Test importing model configuration from a file."""
+        TestModelConfig = {
+            'Temperature': 0.6,
+            'TopP': 0.85,
+            'MaxTokens': 1200
+        }
+        
+        # Import from JSON
+        JsonPath = os.path.join(self.TempDir.name, "test_import.json")
+        with open(JsonPath, 'w') as JsonFile:
+            json.dump(TestModelConfig, JsonFile)
+        
+        self.assertTrue(self.ConfigManager.ImportModelConfig('ImportedModel', JsonPath))
+        self.assertEqual(self.ConfigManager.GetModelConfig('ImportedModel'), TestModelConfig)
+        self.assertEqual(self.ConfigManager.GetUserPreference('RecentModels'), ['ImportedModel'])
+        
+        # Empty files are rejected
+        EmptyPath = os.path.join(self.TempDir.name, "empty.json")
+        open(EmptyPath, 'w').close()
+        self.assertFalse(self.ConfigManager.ImportModelConfig('EmptyModel', EmptyPath))
+    
     def test_ValidateModelConfig(self):
         """Test validation of model configuration."""
         # Valid configuration
@@ -308,6 +513,14 @@ class TestConfigManager(unittest.TestCase):
             'MaxTokens': -100  # Should be positive
         }
         self.assertFalse(self.ConfigManager._ValidateModelConfig(InvalidTokens))
+        
+        # Invalid MaxTokens (bool is not an integer count)
+        BoolTokens = {
+            'Temperature': 0.8,
+            'TopP': 0.9,
+            'MaxTokens': True
+        }
+        self.assertFalse(self.ConfigManager._ValidateModelConfig(BoolTokens))
 
 if __name__ == '__main__':
     unittest.main()
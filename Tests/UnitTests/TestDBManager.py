@@ -0,0 +1,670 @@
+# File: TestDBManager.py
+# Path: OllamaModelEditor/Tests/UnitTests/TestDBManager.py
+# Standard: AIDEV-PascalCase-1.2
+# Created: 2026-10-15
+# Last Modified: 2026-10-15
+# Description: Unit tests for the DBManager module
+
+import os
+import sys
+import sqlite3
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add project root to path for imports
+ProjectRoot = Path(__file__).resolve().parents[2]
+sys.path.append(str(ProjectRoot))
+
+# Import the module to test
+from Core.DBManager import DBManager
+
+class TestDBManager(unittest.TestCase):
+    """Test case for the DBManager class."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        # Create a temporary directory for the test database
+        self.TempDir = tempfile.TemporaryDirectory()
+        self.DBPath = os.path.join(self.TempDir.name, "test.db")
+        
+        # Create a DBManager instance with the test path
+        self.DB = DBManager(self.DBPath)
+    
+    def tearDown(self):
+        """Tear down test fixtures."""
+        # Release pooled connections and clean up temporary directory
+        self.DB.Close()
+        self.TempDir.cleanup()
+    
+    def test_InitialData(self):
+        """Test that default data is seeded on creation."""
+        self.assertTrue(self.DB.GetPresets())
+        self.assertTrue(self.DB.GetAllParameters())
+        self.assertEqual(self.DB.GetUIString('app.title'), 'Ollama Model Editor')
+    
+    def test_PresetCache(self):
+        """Test that cached presets are copied out and refreshed by writes."""
+        Preset = self.DB.GetPreset('Default')
+        self.assertIsNone(Preset['LastUsed'])
+        
+        Preset['Temperature'] = 99
+        self.assertNotEqual(self.DB.GetPreset('Default')['Temperature'], 99)
+        
+        self.assertTrue(self.DB.UpdatePresetUsage('Default'))
+        self.assertIsNotNone(self.DB.GetPreset('Default')['LastUsed'])
+        self.assertIsNone(self.DB.GetPreset('Missing'))
+        
+        # Presets read inside a rolled-back transaction aren't kept in the cache
+        with self.assertRaises(RuntimeError):
+            with self.DB.Transaction():
+                self.DB.SaveUserPreset('Mine', 'Draft', {})
+                self.assertEqual(self.DB.GetUserPreset('Mine')['Description'], 'Draft')
+                raise RuntimeError("Roll back")
+        
+        self.assertIsNone(self.DB.GetUserPreset('Mine'))
+    
+    def test_GetSetUserPreference(self):
+        """Test typed round trip of user preferences."""
+        self.DB.SetUserPreference('Flag', True)
+        self.DB.SetUserPreference('Size', 12)
+        self.DB.SetUserPreference('Ratio', 0.5)
+        self.DB.SetUserPreference('Recent', ['a', 'b'])
+        self.DB.SetUserPreference('Name', 'test')
+        
+        self.assertIs(self.DB.GetUserPreference('Flag'), True)
+        self.assertEqual(self.DB.GetUserPreference('Size'), 12)
+        self.assertEqual(self.DB.GetUserPreference('Ratio'), 0.5)
+        self.assertEqual(self.DB.GetUserPreference('Recent'), ['a', 'b'])
+        self.assertEqual(self.DB.GetUserPreference('Name'), 'test')
+        self.assertEqual(self.DB.GetUserPreference('Missing', 'Default'), 'Default')
+        
+        # Overwrite an existing preference
+        self.DB.SetUserPreference('Size', 14)
+        self.assertEqual(self.DB.GetUserPreference('Size'), 14)
+    
+    def test_SetAppSettingsBulk(self):
+        """Test batched writes of application settings."""
+        self.DB.SetAppSetting('Theme', 'dark', 'UI theme')
+        self.DB.SetAppSettingsBulk([('Theme', 'light'), ('MaxConcurrentRequests', 3)])
+        
+        self.assertEqual(self.DB.GetAppSetting('Theme'), 'light')
+        self.assertEqual(self.DB.GetAppSetting('MaxConcurrentRequests'), 3)
+        
+        # Existing descriptions are preserved
+        Description = self.DB.ExecuteQuery(
+            "SELECT Description FROM AppSettings WHERE Key = ?", ('Theme',)
+        )[0][0]
+        self.assertEqual(Description, 'UI theme')
+    
+    def test_AppSettingCache(self):
+        """Test that cached application settings are refreshed by writes."""
+        self.assertEqual(self.DB.GetAppSetting('Theme', 'system'), 'system')
+        
+        self.DB.SetAppSetting('Theme', 'dark')
+        self.assertEqual(self.DB.GetAppSetting('Theme'), 'dark')
+        
+        self.DB.SetAppSettingsBulk([('Theme', 'light'), ('RecentModels', ['a', 'b'])])
+        self.assertEqual(self.DB.GetAppSetting('Theme'), 'light')
+        
+        # JSON values are decoded per call, so callers can't mutate the cache
+        self.DB.GetAppSetting('RecentModels').append('c')
+        self.assertEqual(self.DB.GetAppSetting('RecentModels'), ['a', 'b'])
+        
+        # User preferences share the same cache and invalidation
+        self.assertIsNone(self.DB.GetUserPreference('FontSize'))
+        self.DB.SetUserPreference('FontSize', 12)
+        self.assertEqual(self.DB.GetUserPreference('FontSize'), 12)
+        self.DB.SetUserPreferencesBulk([('FontSize', 14)])
+        self.assertEqual(self.DB.GetUserPreference('FontSize'), 14)
+    
+    def test_TypedValueCacheRollback(self):
+        """Test that values read inside a rolled-back transaction aren't cached."""
+        self.DB.SetUserPreference('FontSize', 1)
+        self.DB.SetAppSetting('Theme', 'dark')
+        
+        with self.assertRaises(RuntimeError):
+            with self.DB.Transaction():
+                self.DB.SetUserPreference('FontSize', 2)
+                self.DB.SetAppSetting('Theme', 'light')
+                self.assertEqual(self.DB.GetUserPreference('FontSize'), 2)
+                self.assertEqual(self.DB.GetAppSetting('Theme'), 'light')
+                raise RuntimeError("Roll back")
+        
+        self.assertEqual(self.DB.GetUserPreference('FontSize'), 1)
+        self.assertEqual(self.DB.GetAppSetting('Theme'), 'dark')
+        
+        # Committed writes are visible once the block ends
+        with self.DB.Transaction():
+            self.DB.SetUserPreference('FontSize', 3)
+            self.assertEqual(self.DB.GetUserPreference('FontSize'), 3)
+        
+        self.assertEqual(self.DB.GetUserPreference('FontSize'), 3)
+    
+    def test_AppSettingPath(self):
+        """Test reading and updating members of JSON application settings."""
+        self.DB.SetAppSetting('Window', {
+            'Size': {'Width': 800, 'Height': 600}, 'Title': 'Editor', 'Visible': True, 'Parent': None
+        })
+        
+        self.assertEqual(self.DB.GetAppSettingPath('Window', '$.Size.Width'), 800)
+        self.assertEqual(self.DB.GetAppSettingPath('Window', '$.Title'), 'Editor')
+        self.assertEqual(self.DB.GetAppSettingPath('Window', '$.Size'), {'Width': 800, 'Height': 600})
+        self.assertEqual(self.DB.GetAppSettingPath('Window', '$.Missing', 'Default'), 'Default')
+        self.assertIs(self.DB.GetAppSettingPath('Window', '$.Visible'), True)
+        self.assertIsNone(self.DB.GetAppSettingPath('Window', '$.Parent', 'Default'))
+        
+        self.assertTrue(self.DB.SetAppSettingPath('Window', '$.Size.Width', 1024))
+        self.assertTrue(self.DB.SetAppSettingPath('Window', '$.Docks', ['Left']))
+        self.assertEqual(
+            self.DB.GetAppSetting('Window'),
+            {'Size': {'Width': 1024, 'Height': 600}, 'Title': 'Editor', 'Visible': True, 'Parent': None,
+             'Docks': ['Left']}
+        )
+        
+        self.DB.SetAppSetting('Theme', 'dark')
+        self.assertFalse(self.DB.SetAppSettingPath('Theme', '$.Name', 'light'))
+        self.assertFalse(self.DB.SetAppSettingPath('Missing', '$.Name', 'light'))
+        self.assertEqual(self.DB.GetAppSettingPath('Missing', '$.Name', 'Default'), 'Default')
+    
+    def test_ExecuteScalar(self):
+        """Test fetching a single value."""
+        self.assertEqual(
+            self.DB.ExecuteScalar("SELECT DisplayName FROM Parameters WHERE Name = ?", ('Temperature',)),
+            'Temperature'
+        )
+        self.assertIsNone(self.DB.ExecuteScalar("SELECT 1 FROM Parameters WHERE Name = ?", ('Missing',)))
+    
+    def test_TransactionRollback(self):
+        """Test that a failed transaction discards all of its writes."""
+        with self.assertRaises(sqlite3.Error):
+            with self.DB.Transaction():
+                self.DB.SetUserPreference('Pending', 1)
+                self.DB.ExecuteNonQuery("INSERT INTO NoSuchTable VALUES (1)")
+        
+        self.assertIsNone(self.DB.GetUserPreference('Pending'))
+        
+        # A successful transaction commits on exit
+        with self.DB.Transaction():
+            self.DB.SetUserPreference('Committed', 1)
+        
+        self.assertEqual(self.DB.GetUserPreference('Committed'), 1)
+    
+    def test_TransactionTakesWriteLock(self):
+        """Test that transactions hold the write lock from the start."""
+        Other = sqlite3.connect(self.DBPath, timeout=0, isolation_level=None)
+        try:
+            with self.DB.Transaction():
+                with self.assertRaises(sqlite3.OperationalError):
+                    Other.execute("BEGIN IMMEDIATE")
+            
+            Other.execute("BEGIN IMMEDIATE")
+            Other.execute("ROLLBACK")
+        finally:
+            Other.close()
+    
+    def test_UIStringCache(self):
+        """Test that cached UI strings and parameters stay current."""
+        self.assertEqual(self.DB.GetUIString('missing.key'), 'missing.key')
+        self.assertEqual(self.DB.GetUIString('missing.key', 'Fallback'), 'Fallback')
+        
+        # Writes update the cache
+        self.DB.SetUIString('app.title', 'Renamed')
+        self.DB.SetUIString('new.key', 'New')
+        self.assertEqual(self.DB.GetUIString('app.title'), 'Renamed')
+        self.assertEqual(self.DB.GetUIString('new.key'), 'New')
+        self.assertEqual(self.DB.GetUIStrings()['new.key'], 'New')
+        
+        # Writes rolled back with their transaction don't linger in the cache
+        with self.assertRaises(RuntimeError):
+            with self.DB.Transaction():
+                self.DB.SetUIString('app.title', 'Discarded')
+                raise RuntimeError
+        self.assertEqual(self.DB.GetUIString('app.title'), 'Renamed')
+        
+        # Omitted fields keep their stored values
+        self.DB.SetUIString('new.key', 'Newer', 'Description', 'label')
+        self.DB.SetUIString('new.key', 'Newest')
+        self.assertEqual(self.DB.GetUIStrings('label'), {'label.available_models': 'Available Models:', 'new.key': 'Newest'})
+        
+        # Returned parameter definitions are copies of the cached ones
+        self.DB.GetParameter('Temperature')['MaxValue'] = 99
+        self.assertEqual(self.DB.GetParameter('Temperature')['MaxValue'], 2.0)
+        self.assertEqual(
+            [Parameter['Name'] for Parameter in self.DB.GetParametersByCategory('advanced')],
+            ['FrequencyPenalty', 'PresencePenalty']
+        )
+    
+    def test_SetParameters(self):
+        """Test inserting and updating parameter definitions in one call."""
+        Count = len(self.DB.GetAllParameters())
+        
+        self.DB.SetParameters([
+            {'Name': 'Temperature', 'DisplayName': 'Temp', 'MinValue': 0.0, 'MaxValue': 1.5,
+             'DefaultValue': 0.7, 'StepSize': 0.1, 'Category': 'basic', 'OrderIndex': 1},
+            {'Name': 'Seed', 'DisplayName': 'Seed', 'IsInteger': True, 'Category': 'advanced',
+             'OrderIndex': 100}
+        ])
+        
+        self.assertEqual(len(self.DB.GetAllParameters()), Count + 1)
+        self.assertEqual(self.DB.GetParameter('Temperature')['MaxValue'], 1.5)
+        self.assertEqual(self.DB.GetParameter('Temperature')['DisplayName'], 'Temp')
+        self.assertTrue(self.DB.GetParameter('Seed')['IsInteger'])
+    
+    def test_GetUIStringsByKey(self):
+        """Test fetching selected UI strings by key."""
+        Strings = self.DB.GetUIStrings(Keys=['app.title', 'label.available_models', 'missing.key'])
+        self.assertEqual(set(Strings), {'app.title', 'label.available_models'})
+        self.assertEqual(Strings['label.available_models'], 'Available Models:')
+        
+        self.assertEqual(
+            self.DB.GetUIStrings('label', Keys=iter(['app.title', 'label.available_models'])),
+            {'label.available_models': 'Available Models:'}
+        )
+        self.assertEqual(self.DB.GetUIStrings(Keys=[]), {})
+    
+    def test_WalCheckpoint(self):
+        """Test that the WAL file is truncated after enough writes."""
+        self.DB._CheckpointEvery = 5
+        WalPath = self.DBPath + "-wal"
+        
+        for Index in range(4):
+            self.DB.SetUserPreference(f'Key{Index}', Index)
+        self.assertGreater(os.path.getsize(WalPath), 0)
+        
+        # The checkpoint runs on the background worker; wait for it to finish
+        self.DB.SetUserPreference('Key4', 4)
+        self.DB._SubmitBackground(lambda: None).result(timeout=10)
+        self.assertEqual(os.path.getsize(WalPath), 0)
+    
+    def test_ConnectionPool(self):
+        """Test that connections are reused per thread and released on close."""
+        Conn = self.DB.GetConnection()
+        self.assertIs(self.DB.GetConnection(), Conn)
+        
+        # Other threads get their own connection
+        OtherConns = []
+        Worker = threading.Thread(target=lambda: OtherConns.append(self.DB.GetConnection()))
+        Worker.start()
+        Worker.join()
+        self.assertIsNot(OtherConns[0], Conn)
+        
+        # Closing releases every connection; the next call opens a fresh one
+        self.DB.Close()
+        with self.assertRaises(sqlite3.ProgrammingError):
+            Conn.execute("SELECT 1")
+        self.assertIsNot(self.DB.GetConnection(), Conn)
+        self.assertEqual(self.DB.GetUIString('app.title'), 'Ollama Model Editor')
+    
+    def test_SaveModelConfig(self):
+        """Test saving and updating model configurations."""
+        Params = {'Temperature': 0.5, 'TopP': 0.8, 'MaxTokens': 1000}
+        ConfigID = self.DB.SaveModelConfig('TestModel', 'Default', Params)
+        
+        # Updating keeps the same row
+        Params['Temperature'] = 0.9
+        self.assertEqual(self.DB.SaveModelConfig('TestModel', 'Default', Params), ConfigID)
+        
+        Config = self.DB.GetModelConfig('TestModel')
+        self.assertEqual(Config['ID'], ConfigID)
+        self.assertEqual(Config['Temperature'], 0.9)
+        self.assertEqual(len(self.DB.GetModelConfigs('TestModel')), 1)
+    
+    def test_BulkSaveModelConfigs(self):
+        """Test batched saving of model configurations."""
+        self.DB.SaveModelConfig('ModelA', 'Default', {'Temperature': 0.1})
+        self.DB.BulkSaveModelConfigs([
+            ('ModelA', 'Default', {'Temperature': 0.2}),
+            ('ModelA', 'Creative', {'Temperature': 1.0}),
+            ('ModelB', 'Default', {'MaxTokens': 512})
+        ])
+        
+        self.assertEqual(len(self.DB.GetModelConfigs('ModelA')), 2)
+        self.assertEqual(self.DB.GetModelConfig('ModelA')['Temperature'], 0.2)
+        self.assertEqual(self.DB.GetModelConfig('ModelB')['MaxTokens'], 512)
+    
+    def test_ReopenCurrentSchema(self):
+        """Test that reopening an up-to-date database skips the schema script."""
+        self.DB.ExecuteNonQuery("DROP INDEX IX_BenchmarkResults_ConfigID")
+        self.DB.Close()
+        
+        # Current version: the dropped index is not recreated
+        DB = DBManager(self.DBPath)
+        try:
+            Indexes = DB.ExecuteQuery("SELECT name FROM sqlite_master WHERE name = 'IX_BenchmarkResults_ConfigID'")
+            self.assertEqual(Indexes, [])
+            
+            # An older version gets the schema script and the new version recorded
+            DB.ExecuteNonQuery("DELETE FROM DBVersion WHERE Version = 4")
+            DB.ExecuteNonQuery("INSERT INTO DBVersion (Version) VALUES (3)")
+        finally:
+            DB.Close()
+        
+        DB = DBManager(self.DBPath)
+        try:
+            Indexes = DB.ExecuteQuery("SELECT name FROM sqlite_master WHERE name = 'IX_BenchmarkResults_ConfigID'")
+            self.assertEqual(len(Indexes), 1)
+            self.assertEqual(DB.ExecuteQuery("SELECT MAX(Version) FROM DBVersion")[0][0], 4)
+            self.assertTrue(DB.GetPresets())
+        finally:
+            DB.Close()
+    
+    def test_OldSQLiteSupported(self):
+        """Test that older SQLite builds can still open and use the database."""
+        with mock.patch('sqlite3.sqlite_version_info', (3, 34, 1)):
+            DB = DBManager(os.path.join(self.TempDir.name, "old.db"))
+            try:
+                Schema = ' '.join(Row[0] for Row in DB.ExecuteQuery("SELECT sql FROM sqlite_master WHERE sql IS NOT NULL"))
+                self.assertNotIn('unixepoch', Schema)
+                
+                DB.SetAppSetting('Theme', 'dark')
+                self.assertIsInstance(
+                    DB.ExecuteScalar("SELECT UpdatedAt FROM AppSettings WHERE Key = ?", ('Theme',)), int
+                )
+            finally:
+                DB.Close()
+    
+    def test_UpsertWithoutReturning(self):
+        """Test that saves report the row ID on SQLite builds without RETURNING."""
+        with mock.patch('Core.DBManager._HasReturning', False):
+            ConfigID = self.DB.SaveModelConfig('ModelA', 'Default', {'Temperature': 0.2})
+            self.DB.SaveModelConfig('ModelB', 'Default', {})
+            self.assertEqual(self.DB.SaveModelConfig('ModelA', 'Default', {'Temperature': 0.3}), ConfigID)
+            self.assertEqual(self.DB.GetModelConfig('ModelA')['Temperature'], 0.3)
+            
+            PresetID = self.DB.SaveUserPreset('Mine', 'First', {})
+            self.DB.SaveUserPreset('Other', 'Other', {})
+            self.assertEqual(self.DB.SaveUserPreset('Mine', 'Second', {}), PresetID)
+    
+    def test_MigrateEpochTimestamps(self):
+        """Test that version 1 databases are upgraded to integer timestamps."""
+        LegacyPath = os.path.join(self.TempDir.name, "legacy.db")
+        
+        with sqlite3.connect(LegacyPath) as Conn:
+            Conn.executescript(
+                """
+                CREATE TABLE DBVersion (
+                    Version INTEGER PRIMARY KEY,
+                    AppliedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+                CREATE TABLE ModelConfigs (
+                    ID INTEGER PRIMARY KEY AUTOINCREMENT,
+                    ModelName TEXT NOT NULL,
+                    ConfigName TEXT NOT NULL,
+                    Temperature REAL DEFAULT 0.7,
+                    TopP REAL DEFAULT 0.9,
+                    MaxTokens INTEGER DEFAULT 2048,
+                    FrequencyPenalty REAL DEFAULT 0.0,
+                    PresencePenalty REAL DEFAULT 0.0,
+                    CreatedAt TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                    LastUsed TIMESTAMP,
+                    IsDefault BOOLEAN DEFAULT 0,
+                    UNIQUE(ModelName, ConfigName)
+                );
+                INSERT INTO DBVersion (Version) VALUES (1);
+                INSERT INTO ModelConfigs (ModelName, ConfigName, Temperature, CreatedAt)
+                VALUES ('TestModel', 'Default', 0.5, '2025-03-12 20:45:00');
+                """
+            )
+        Conn.close()
+        
+        DB = DBManager(LegacyPath)
+        try:
+            Config = DB.GetModelConfig('TestModel')
+            self.assertEqual(Config['CreatedAt'], 1741812300)
+            self.assertEqual(Config['Temperature'], 0.5)
+            self.assertEqual(DB.ExecuteQuery("SELECT MAX(Version) FROM DBVersion")[0][0], 4)
+            
+            # New rows get integer defaults
+            DB.SaveModelConfig('NewModel', 'Default', {})
+            self.assertIsInstance(DB.GetModelConfig('NewModel')['CreatedAt'], int)
+        finally:
+            DB.Close()
+    
+    def test_MigrateNativeValues(self):
+        """Test that version 2 key/value tables are upgraded to native value storage."""
+        LegacyPath = os.path.join(self.TempDir.name, "legacy.db")
+        
+        with sqlite3.connect(LegacyPath) as Conn:
+            Conn.executescript(
+                """
+                CREATE TABLE DBVersion (
+                    Version INTEGER PRIMARY KEY,
+                    AppliedAt INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+                );
+                CREATE TABLE UserPreferences (
+                    Key TEXT PRIMARY KEY,
+                    Value TEXT,
+                    ValueType TEXT,
+                    UpdatedAt INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+                );
+                INSERT INTO DBVersion (Version) VALUES (2);
+                INSERT INTO UserPreferences (Key, Value, ValueType) VALUES
+                    ('Size', '12', 'int'), ('Ratio', '0.5', 'float'),
+                    ('Flag', 'true', 'bool'), ('Recent', '["a"]', 'json'), ('Name', '12', 'string');
+                """
+            )
+        Conn.close()
+        
+        DB = DBManager(LegacyPath)
+        try:
+            self.assertEqual(
+                [tuple(Row) for Row in DB.ExecuteQuery("SELECT Key, typeof(Value) FROM UserPreferences ORDER BY Key")],
+                [('Flag', 'integer'), ('Name', 'text'), ('Ratio', 'real'), ('Recent', 'text'), ('Size', 'integer')]
+            )
+            self.assertIs(DB.GetUserPreference('Flag'), True)
+            self.assertEqual(DB.GetUserPreference('Size'), 12)
+            self.assertEqual(DB.GetUserPreference('Ratio'), 0.5)
+            self.assertEqual(DB.GetUserPreference('Recent'), ['a'])
+            self.assertEqual(DB.GetUserPreference('Name'), '12')
+        finally:
+            DB.Close()
+    
+    def test_RestoreLegacyBackup(self):
+        """Test that restoring a backup from an older schema version migrates it."""
+        BackupPath = os.path.join(self.TempDir.name, "legacy_backup.db")
+        
+        with sqlite3.connect(BackupPath) as Conn:
+            Conn.executescript(
+                """
+                CREATE TABLE DBVersion (
+                    Version INTEGER PRIMARY KEY,
+                    AppliedAt INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+                );
+                CREATE TABLE UserPreferences (
+                    Key TEXT PRIMARY KEY,
+                    Value TEXT,
+                    ValueType TEXT,
+                    UpdatedAt INTEGER DEFAULT (CAST(strftime('%s', 'now') AS INTEGER))
+                );
+                INSERT INTO DBVersion (Version) VALUES (2);
+                INSERT INTO UserPreferences (Key, Value, ValueType) VALUES ('Flag', 'false', 'bool');
+                """
+            )
+        Conn.close()
+        
+        self.assertTrue(self.DB.RestoreDatabase(BackupPath))
+        
+        self.assertIs(self.DB.GetUserPreference('Flag'), False)
+        self.assertEqual(self.DB.ExecuteScalar("SELECT MAX(Version) FROM DBVersion"), 4)
+        self.assertTrue(self.DB.GetPresets())
+    
+    def test_GenerationHistory(self):
+        """Test single and batched generation history writes."""
+        EntryID = self.DB.AddGenerationHistory('ModelA', 'Prompt', 'Response', {'Temperature': 0.2}, {'TotalTokens': 5})
+        self.DB.BulkAddGenerationHistory([
+            ('ModelA', 'Prompt 2', 'Response 2', {}, {}),
+            ('ModelB', 'Prompt 3', 'Response 3', {}, {'GenerationTime': 1.5})
+        ])
+        
+        self.assertEqual(len(self.DB.GetGenerationHistory()), 3)
+        
+        History = self.DB.GetGenerationHistoryForModel('ModelA')
+        self.assertEqual(len(History), 2)
+        self.assertIn(EntryID, [Entry['ID'] for Entry in History])
+        self.assertEqual(self.DB.GetGenerationHistoryForModel('ModelB')[0]['GenerationTime'], 1.5)
+        
+        self.assertEqual(self.DB.ClearGenerationHistory(), 3)
+        self.assertEqual(self.DB.GetGenerationHistory(), [])
+    
+    def test_EnqueueGenerationHistory(self):
+        """Test that queued history entries are written in the background."""
+        for Index in range(250):
+            self.DB.EnqueueGenerationHistory('ModelA', f'Prompt {Index}', 'Response', {}, {'TotalTokens': Index})
+        
+        self.DB.FlushGenerationHistory()
+        self.assertEqual(self.DB.ExecuteQuery("SELECT COUNT(*) FROM GenerationHistory")[0][0], 250)
+        
+        # Closing writes out entries still in the queue
+        self.DB.EnqueueGenerationHistory('ModelB', 'Prompt', 'Response', {}, {})
+        self.DB.Close()
+        self.assertEqual(len(self.DB.GetGenerationHistoryForModel('ModelB')), 1)
+    
+    def test_ResetGenerationHistory(self):
+        """Test that resetting history empties it and restarts entry IDs."""
+        self.DB.BulkAddGenerationHistory(('ModelA', 'Prompt', 'Response', {}, {}) for _ in range(3))
+        
+        self.DB.ResetGenerationHistory()
+        self.assertEqual(self.DB.GetGenerationHistory(), [])
+        self.assertEqual(self.DB.AddGenerationHistory('ModelA', 'Prompt', 'Response', {}, {}), 1)
+        
+        Indexes = {Row[0] for Row in self.DB.ExecuteQuery(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'GenerationHistory'"
+        )}
+        self.assertIn('IX_GenerationHistory_ModelName', Indexes)
+        self.assertIn('IX_GenerationHistory_CreatedAt', Indexes)
+    
+    def test_IncrementalVacuumOnExistingDB(self):
+        """Test that databases created without auto_vacuum are switched over once."""
+        LegacyPath = os.path.join(self.TempDir.name, "legacy.db")
+        
+        with sqlite3.connect(LegacyPath) as Conn:
+            Conn.execute("CREATE TABLE Legacy (ID INTEGER PRIMARY KEY)")
+        Conn.close()
+        
+        DB = DBManager(LegacyPath)
+        try:
+            self.assertEqual(DB.ExecuteScalar("PRAGMA auto_vacuum"), 2)
+            
+            # Freed history pages are now returned to the file system
+            DB.BulkAddGenerationHistory(('ModelA', 'Prompt' * 1000, 'Response' * 1000, {}, {}) for _ in range(50))
+            DB.ResetGenerationHistory()
+            self.assertEqual(DB.ExecuteScalar("PRAGMA freelist_count"), 0)
+        finally:
+            DB.Close()
+    
+    def test_GenerationHistoryPage(self):
+        """Test keyset pagination over generation history."""
+        self.DB.BulkAddGenerationHistory(
+            (f'Model{Index % 2}', f'Prompt {Index}', 'Response', {}, {}) for Index in range(5)
+        )
+        
+        Seen = []
+        BeforeID = None
+        while True:
+            Page, BeforeID = self.DB.GetGenerationHistoryPage(BeforeID, Limit=2)
+            Seen.extend(Entry['ID'] for Entry in Page)
+            if BeforeID is None:
+                break
+        
+        self.assertEqual(Seen, sorted(Seen, reverse=True))
+        self.assertEqual(len(Seen), 5)
+        
+        Page, BeforeID = self.DB.GetGenerationHistoryPage(Limit=5, ModelName='Model0')
+        self.assertEqual([Entry['Prompt'] for Entry in Page], ['Prompt 4', 'Prompt 2', 'Prompt 0'])
+        self.assertIsNone(BeforeID)
+        
+        # Summary pages leave out the text, which is loaded per entry
+        Summaries, _ = self.DB.GetGenerationHistoryPage(Limit=5, ModelName='Model0', IncludeText=False)
+        self.assertEqual([Entry['ID'] for Entry in Summaries], [Entry['ID'] for Entry in Page])
+        self.assertNotIn('Prompt', Summaries[0])
+        self.assertEqual(self.DB.GetGenerationHistoryEntry(Summaries[0]['ID']), Page[0])
+        self.assertIsNone(self.DB.GetGenerationHistoryEntry(-1))
+    
+    def test_AddBenchmarkResult(self):
+        """Test that benchmark results are stored with their configuration."""
+        ResultID = self.DB.AddBenchmarkResult('Speed', 'ModelA', 'Prompt', 1.5, 100, 66.7, 3, {'Temperature': 0.3})
+        
+        Results = self.DB.GetBenchmarkResults('ModelA')
+        self.assertEqual(len(Results), 1)
+        self.assertEqual(Results[0]['ID'], ResultID)
+        self.assertEqual(Results[0]['Temperature'], 0.3)
+        self.assertEqual(Results[0]['ConfigID'], self.DB.GetModelConfig('ModelA', 'Benchmark-Speed')['ID'])
+        self.assertEqual(self.DB.GetBenchmarkResults('ModelB'), [])
+    
+    def test_BackupAndRestore(self):
+        """Test backing up and restoring through the pooled connection."""
+        BackupPath = os.path.join(self.TempDir.name, "backup.db")
+        
+        self.DB.SetUIString('AppTitle', 'Backed Up Title')
+        self.assertTrue(self.DB.BackupDatabase(BackupPath))
+        
+        self.DB.SetUIString('AppTitle', 'Changed Title')
+        self.assertEqual(self.DB.GetUIString('AppTitle'), 'Changed Title')
+        
+        self.assertTrue(self.DB.RestoreDatabase(BackupPath))
+        self.assertEqual(self.DB.GetUIString('AppTitle'), 'Backed Up Title')
+        
+        # Backing up again replaces the earlier file
+        self.DB.SetUIString('AppTitle', 'Second Title')
+        self.assertTrue(self.DB.BackupDatabase(BackupPath))
+        self.assertFalse(os.path.exists(BackupPath + ".tmp"))
+        self.DB.SetUIString('AppTitle', 'Changed Title')
+        self.assertTrue(self.DB.RestoreDatabase(BackupPath))
+        self.assertEqual(self.DB.GetUIString('AppTitle'), 'Second Title')
+        self.assertFalse(self.DB.RestoreDatabase(os.path.join(self.TempDir.name, "missing.db")))
+    
+    def test_BackupInsideTransaction(self):
+        """Test backing up from inside a transaction on the same thread."""
+        BackupPath = os.path.join(self.TempDir.name, "backup.db")
+        
+        self.DB.SetUIString('AppTitle', 'Committed Title')
+        with self.DB.Transaction():
+            self.DB.SetUIString('AppTitle', 'Pending Title')
+            self.assertTrue(self.DB.BackupDatabase(BackupPath))
+        
+        # The backup holds the committed state, not the pending change
+        self.assertTrue(self.DB.RestoreDatabase(BackupPath))
+        self.assertEqual(self.DB.GetUIString('AppTitle'), 'Committed Title')
+    
+    def test_BackupDatabaseAsync(self):
+        """Test backing up on the background backup thread."""
+        BackupPath = os.path.join(self.TempDir.name, "async", "backup.db")
+        
+        self.DB.SetUIString('AppTitle', 'Async Title')
+        self.assertTrue(self.DB.BackupDatabaseAsync(BackupPath).result(timeout=10))
+        
+        self.DB.SetUIString('AppTitle', 'Changed Title')
+        self.assertTrue(self.DB.RestoreDatabase(BackupPath))
+        self.assertEqual(self.DB.GetUIString('AppTitle'), 'Async Title')
+    
+    def test_HistoryQueriesUseIndexes(self):
+        """Test that per-model history and benchmark queries avoid scans and sorts."""
+        for Table in ('GenerationHistory', 'BenchmarkResults'):
+            Plan = ' '.join(
+                Row[3] for Row in self.DB.ExecuteQuery(
+                    f"EXPLAIN QUERY PLAN SELECT ID FROM {Table} WHERE ModelName = ? ORDER BY CreatedAt DESC",
+                    ('ModelA',)
+                )
+            )
+            self.assertIn(f'IX_{Table}_ModelName', Plan)
+            self.assertNotIn('TEMP B-TREE', Plan)
+    
+    def test_SaveUserPreset(self):
+        """Test saving and updating user presets."""
+        PresetID = self.DB.SaveUserPreset('Mine', 'First', {'Temperature': 0.4})
+        self.assertEqual(self.DB.SaveUserPreset('Mine', 'Second', {'Temperature': 0.6}), PresetID)
+        
+        Presets = self.DB.GetUserPresets()
+        self.assertEqual(len(Presets), 1)
+        self.assertEqual(Presets[0]['Description'], 'Second')
+        self.assertEqual(Presets[0]['Temperature'], 0.6)
+        self.assertEqual(self.DB.GetUserPreset('Mine'), Presets[0])
+        self.assertTrue(self.DB.DeleteUserPreset('Mine'))
+        self.assertIsNone(self.DB.GetUserPreset('Mine'))
+        self.assertFalse(self.DB.DeleteUserPreset('Mine'))
+
+if __name__ == '__main__':
+    unittest.main()
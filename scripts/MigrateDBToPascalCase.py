@@ -248,7 +248,7 @@ def MigrateDatabase(DBPath: str, Force: bool = False) -> bool:
         Cursor = Conn.cursor()
         for SQL in MigrationScript:
             try:
-                Logger.debug(f"Executing: {SQL}")
+                Logger.debug("Executing: %s", SQL)
                 Cursor.execute(SQL)
             except sqlite3.Error as Error:
                 Logger.error(f"Error executing SQL: {Error}")
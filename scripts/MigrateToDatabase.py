@@ -68,14 +68,15 @@ def MigrateToDatabase(ConfigPath=None, DBPath=None):
     SuccessCount = 0
     TotalCount = len(Config.AppConfig)
     
-    # Migrate application settings
-    for Key, Value in Config.AppConfig.items():
-        try:
-            DB.SetAppSetting(Key, Value)
-            SuccessCount += 1
-            print(f"  • Setting migrated: {Key}")
-        except Exception as Error:
-            print(f"  × Error migrating setting {Key}: {Error}")
+    # Migrate application settings in a single transaction
+    with DB.Transaction():
+        for Key, Value in Config.AppConfig.items():
+            try:
+                DB.SetAppSetting(Key, Value)
+                SuccessCount += 1
+                print(f"  • Setting migrated: {Key}")
+            except Exception as Error:
+                print(f"  × Error migrating setting {Key}: {Error}")
     
     print(f"Migrated {SuccessCount} of {TotalCount} application settings.")
     
@@ -83,14 +84,15 @@ def MigrateToDatabase(ConfigPath=None, DBPath=None):
     SuccessCount = 0
     TotalCount = len(Config.UserPreferences)
     
-    # Migrate user preferences
-    for Key, Value in Config.UserPreferences.items():
-        try:
-            DB.SetUserPreference(Key, Value)
-            SuccessCount += 1
-            print(f"  • Preference migrated: {Key}")
-        except Exception as Error:
-            print(f"  × Error migrating preference {Key}: {Error}")
+    # Migrate user preferences in a single transaction
+    with DB.Transaction():
+        for Key, Value in Config.UserPreferences.items():
+            try:
+                DB.SetUserPreference(Key, Value)
+                SuccessCount += 1
+                print(f"  • Preference migrated: {Key}")
+            except Exception as Error:
+                print(f"  × Error migrating preference {Key}: {Error}")
     
     print(f"Migrated {SuccessCount} of {TotalCount} user preferences.")
     